@@ -1,21 +1,25 @@
 #!/usr/bin/env python3
-import json
 import random
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, chain, repeat
 
-# Set random seed for reproducible results
-random.seed(42)
+from content_io import atomic_write_bytes, dump_indent2, load_json
+
+# Local seeded RNG for reproducible results (doesn't touch global random state)
+rng = random.Random(42)
 
 # Define movement options
-movements = (
-    ["Forward"] * 100 +
-    ["-"] * 100 +
-    [f"{direction} {degrees}°" for direction in ["Left", "Right"] 
-     for degrees in [45, 90, 135, 180, 270]] * 12  # ~60 total
-)
+directional = [f"{direction} {degrees}°" for direction in ("Left", "Right")
+               for degrees in (45, 90, 135, 180, 270)]
+movements = list(chain(
+    repeat("Forward", 100),
+    repeat("-", 100),
+    chain.from_iterable(repeat(directional, 12))  # ~60 total
+))
 
 # Shuffle the movements
-random.shuffle(movements)
+rng.shuffle(movements)
 
 pattern_files = [
     "9th_keup_patterns.json",
@@ -32,38 +36,49 @@ pattern_files = [
 ]
 
 base_path = "/Users/craig/TKDojang/TKDojang/Sources/Core/Data/Content/Patterns"
-movement_index = 0
 
-print("🔄 Adding movement and execution_speed fields to all pattern JSON files...")
 
-for filename in pattern_files:
-    filepath = os.path.join(base_path, filename)
-    
-    print(f"📝 Processing {filename}...")
-    
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    
+def update_pattern_file(filepath, data, file_movements):
+    """Assign this file's slice of movements to its moves and write it back"""
     total_moves = 0
     for pattern in data['patterns']:
         for move in pattern['moves']:
             # Add execution_speed (always "normal")
             move['execution_speed'] = "normal"
-            
-            # Add movement (from our shuffled list)
-            if movement_index < len(movements):
-                move['movement'] = movements[movement_index]
-                movement_index += 1
+
+            # Add movement (from this file's slice of the shuffled list)
+            if total_moves < len(file_movements):
+                move['movement'] = file_movements[total_moves]
                 total_moves += 1
             else:
                 move['movement'] = "-"  # fallback
-    
+
     # Write back to file with proper formatting
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    atomic_write_bytes(filepath, dump_indent2(data))
+
+    return total_moves
+
+
+print("🔄 Adding movement and execution_speed fields to all pattern JSON files...")
+
+filepaths = [os.path.join(base_path, filename) for filename in pattern_files]
+
+with ThreadPoolExecutor(max_workers=len(filepaths)) as executor:
+    # First pass: load every file so each one's share of the shuffled
+    # movements is known up front and files no longer depend on each other
+    datas = list(executor.map(load_json, filepaths))
+    counts = [sum(len(pattern['moves']) for pattern in data['patterns']) for data in datas]
+    offsets = [0, *accumulate(counts)]
+    slices = [movements[offsets[i]:offsets[i + 1]] for i in range(len(filepaths))]
+
+    # Second pass: assign and write each file independently
+    updated_counts = list(executor.map(update_pattern_file, filepaths, datas, slices))
+
+for filename, total_moves in zip(pattern_files, updated_counts):
     print(f"✅ Updated {total_moves} moves in {filename}")
 
+movement_index = sum(updated_counts)
+
 print(f"\n🎯 Migration complete! Updated {movement_index} moves across all patterns")
 print("📊 Distribution summary:")
 print(f"   Forward: ~100 moves")
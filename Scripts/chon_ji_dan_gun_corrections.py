@@ -9,25 +9,59 @@ This script applies corrections to Chon Ji and Dan Gun patterns:
 4. Fix typos and inconsistencies
 """
 
-import json
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Any
 
+from content_io import atomic_write_bytes, dump_indent2, load_json
+
+def _format_correction(correction: Dict) -> str:
+    """Format a single correction for the report"""
+    return f"  Move {correction['move']}: {correction['field']} - {correction['old']} → {correction['new']}"
+
 class ChonJiDanGunCorrector:
-    def __init__(self):
+    # Techniques with an embedded target section -> (technique, target)
+    _TECHNIQUE_MAP = {
+        "Low Outer Forearm Block": ("Outer Forearm Block", "Low Section"),
+        "Middle Obverse Punch": ("Obverse Punch", "Middle Section"),
+        "High Obverse Punch": ("Obverse Punch", "High Section"),
+        "Middle Inner Forearm Block": ("Inner Forearm Block", "Middle Section"),
+        "High Obverse Block": ("Outer Forearm Block", "High Section"),
+        "Rising Block": ("Forearm Rising Block", "High Section"),
+    }
+
+    # Known technique typos -> corrected spelling
+    _TYPO_MAP = {
+        "High Observe Punch": "High Obverse Punch",  # Dan-Gun move 4
+        "Twin Outer Forearm Bloack": "Twin Outer Forearm Block",  # Dan-Gun move 11
+    }
+
+    # Lowercased target variants -> standard section name
+    _TARGET_MAP = {
+        "lower section": "Low Section",
+        "low section": "Low Section",
+        "middle section": "Middle Section",
+        "solar plexus": "Middle Section",
+        "upper section": "High Section",
+        "high section": "High Section",
+        "head level": "High Section",
+    }
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.corrections_applied = []
         
     def apply_corrections(self, pattern_file_path: str) -> bool:
         """Apply corrections to a pattern file"""
         try:
-            with open(pattern_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(pattern_file_path)
             
             corrections_made = False
             file_corrections = []
             
-            for pattern in data.get('patterns', []):
+            for pattern in data.get('patterns') or ():
                 pattern_name = pattern.get('name', 'Unknown')
                 
                 if pattern_name == "Chon-Ji":
@@ -35,18 +69,21 @@ class ChonJiDanGunCorrector:
                 elif pattern_name == "Dan-Gun":
                     corrections_made |= self._correct_dan_gun(pattern, file_corrections)
                     
+            lines = []
             if corrections_made:
-                with open(pattern_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                atomic_write_bytes(pattern_file_path, dump_indent2(data))
                 
                 self.corrections_applied.extend(file_corrections)
-                print(f"✓ Updated {len(file_corrections)} corrections in {os.path.basename(pattern_file_path)}")
+                lines.append(f"✓ Updated {len(file_corrections)} corrections in {os.path.basename(pattern_file_path)}")
                 
-                # Print detailed corrections
-                for correction in file_corrections:
-                    print(f"  Move {correction['move']}: {correction['field']} - {correction['old']} → {correction['new']}")
+                # Detailed corrections (also listed in the final summary)
+                if self.verbose:
+                    lines.extend(_format_correction(correction) for correction in file_corrections)
             else:
-                print(f"  No corrections needed in {os.path.basename(pattern_file_path)}")
+                lines.append(f"  No corrections needed in {os.path.basename(pattern_file_path)}")
+            
+            # One write per file rather than one per correction
+            sys.stdout.write('\n'.join(lines) + '\n')
                 
             return corrections_made
             
@@ -58,52 +95,9 @@ class ChonJiDanGunCorrector:
         """Apply corrections specific to Chon Ji pattern"""
         corrections_made = False
         
-        for move in pattern.get('moves', []):
-            move_num = move.get('move_number', 0)
-            
-            # Remove Left/Right prefixes from stances
-            stance = move.get('stance', '')
-            if stance.startswith('Left ') or stance.startswith('Right '):
-                old_stance = stance
-                new_stance = stance.replace('Left ', '').replace('Right ', '')
-                # Fix "L Stance" to "L-stance"
-                if new_stance == "L Stance":
-                    new_stance = "L-stance"
-                move['stance'] = new_stance
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'stance',
-                    'old': old_stance,
-                    'new': new_stance
-                })
-            
-            # Split techniques that contain target sections
-            technique = move.get('technique', '')
-            target = move.get('target', '')
-            
-            # Handle technique/target corrections
-            new_technique, new_target = self._split_technique_target(technique, target, move_num)
-            
-            if new_technique != technique:
-                move['technique'] = new_technique
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'technique',
-                    'old': technique,
-                    'new': new_technique
-                })
-            
-            if new_target != target:
-                move['target'] = new_target
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'target',
-                    'old': target,
-                    'new': new_target
-                })
+        for move in pattern.get('moves') or ():
+            corrections_made |= self._fix_stance(move, file_corrections)
+            corrections_made |= self._fix_technique_target(move, move.get('technique', ''), file_corrections, "Chon-Ji")
                 
         return corrections_made
     
@@ -111,124 +105,122 @@ class ChonJiDanGunCorrector:
         """Apply corrections specific to Dan Gun pattern"""
         corrections_made = False
         
-        for move in pattern.get('moves', []):
+        for move in pattern.get('moves') or ():
             move_num = move.get('move_number', 0)
-            
-            # Remove Left/Right prefixes from stances
-            stance = move.get('stance', '')
-            if stance.startswith('Left ') or stance.startswith('Right '):
-                old_stance = stance
-                new_stance = stance.replace('Left ', '').replace('Right ', '')
-                # Fix "L Stance" to "L-stance"
-                if new_stance == "L Stance":
-                    new_stance = "L-stance"
-                move['stance'] = new_stance
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'stance',
-                    'old': old_stance,
-                    'new': new_stance
-                })
+            corrections_made |= self._fix_stance(move, file_corrections)
             
             # Fix specific technique typos
             technique = move.get('technique', '')
-            if technique == "High Observe Punch":  # Move 4 typo
-                move['technique'] = "High Obverse Punch"
+            fixed = self._TYPO_MAP.get(technique)
+            if fixed:
+                move['technique'] = fixed
                 corrections_made = True
                 file_corrections.append({
                     'move': move_num,
                     'field': 'technique',
                     'old': technique,
-                    'new': "High Obverse Punch"
+                    'new': fixed
                 })
-                technique = "High Obverse Punch"
-                
-            if technique == "Twin Outer Forearm Bloack":  # Move 11 typo
-                move['technique'] = "Twin Outer Forearm Block"
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'technique',
-                    'old': technique,
-                    'new': "Twin Outer Forearm Block"
-                })
-                technique = "Twin Outer Forearm Block"
+                technique = fixed
             
             # Split techniques that contain target sections
-            target = move.get('target', '')
-            new_technique, new_target = self._split_technique_target(technique, target, move_num, pattern_name="Dan-Gun")
-            
-            if new_technique != technique:
-                move['technique'] = new_technique
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'technique',
-                    'old': technique,
-                    'new': new_technique
-                })
-            
-            if new_target != target:
-                move['target'] = new_target
-                corrections_made = True
-                file_corrections.append({
-                    'move': move_num,
-                    'field': 'target',
-                    'old': target,
-                    'new': new_target
-                })
+            corrections_made |= self._fix_technique_target(move, technique, file_corrections, "Dan-Gun")
                 
         return corrections_made
     
+    def _fix_stance(self, move: Dict, file_corrections: List) -> bool:
+        """Remove Left/Right prefixes from a move's stance"""
+        stance = move.get('stance', '')
+        if not (stance.startswith('Left ') or stance.startswith('Right ')):
+            return False
+        
+        new_stance = stance.removeprefix('Left ').removeprefix('Right ')
+        # Fix "L Stance" to "L-stance"
+        if new_stance == "L Stance":
+            new_stance = "L-stance"
+        move['stance'] = new_stance
+        file_corrections.append({
+            'move': move.get('move_number', 0),
+            'field': 'stance',
+            'old': stance,
+            'new': new_stance
+        })
+        return True
+    
+    def _fix_technique_target(self, move: Dict, technique: str, file_corrections: List, pattern_name: str) -> bool:
+        """Split techniques that contain target sections and standardize the target"""
+        move_num = move.get('move_number', 0)
+        target = move.get('target', '')
+        corrections_made = False
+        
+        new_technique, new_target = self._split_technique_target(technique, target, move_num, pattern_name=pattern_name)
+        
+        if new_technique != technique:
+            move['technique'] = new_technique
+            corrections_made = True
+            file_corrections.append({
+                'move': move_num,
+                'field': 'technique',
+                'old': technique,
+                'new': new_technique
+            })
+        
+        if new_target != target:
+            move['target'] = new_target
+            corrections_made = True
+            file_corrections.append({
+                'move': move_num,
+                'field': 'target',
+                'old': target,
+                'new': new_target
+            })
+        
+        return corrections_made
+    
     def _split_technique_target(self, technique: str, current_target: str, move_num: int, pattern_name: str = "Chon-Ji") -> tuple:
         """Split technique names that contain target sections and standardize targets"""
         
         # Handle techniques with embedded targets
-        if technique == "Low Outer Forearm Block":
-            return "Outer Forearm Block", "Low Section"
-        elif technique == "Middle Obverse Punch":
-            return "Obverse Punch", "Middle Section"
-        elif technique == "High Obverse Punch":
-            return "Obverse Punch", "High Section"
-        elif technique == "Middle Inner Forearm Block":
-            return "Inner Forearm Block", "Middle Section"
-        elif technique == "High Obverse Block":
-            return "Outer Forearm Block", "High Section"
-        elif technique == "Rising Block":
-            return "Forearm Rising Block", "High Section"
+        mapped = self._TECHNIQUE_MAP.get(technique)
+        if mapped:
+            return mapped
         
         # If no technique change needed, just standardize target
         new_target = self._standardize_target(current_target)
         return technique, new_target
     
-    def _standardize_target(self, target: str) -> str:
-        """Standardize target section names"""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _standardize_target(target: str) -> str:
+        """Standardize target section names (pure, so memoized)"""
         if not target or target == "null":
             return target
             
-        # Convert various target formats to standard sections
-        target_lower = target.lower()
-        
-        if target_lower in ["lower section", "low section"]:
-            return "Low Section"
-        elif target_lower in ["middle section", "solar plexus"]:
-            return "Middle Section"
-        elif target_lower in ["upper section", "high section", "head level"]:
-            return "High Section"
-        
-        # Return original if no match (for now)
-        return target
+        # Convert various target formats to standard sections,
+        # returning original if no match (for now)
+        return ChonJiDanGunCorrector._TARGET_MAP.get(target.lower(), target)
 
 def main():
     """Main function to run corrections"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Apply Chon-Ji and Dan-Gun pattern corrections'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='List each correction as its file is processed'
+    )
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     patterns_dir = script_dir.parent / "TKDojang/Sources/Core/Data/Content/Patterns"
     
     print("Chon Ji and Dan Gun Pattern Corrections")
     print("=====================================")
     
-    corrector = ChonJiDanGunCorrector()
+    corrector = ChonJiDanGunCorrector(verbose=args.verbose)
     
     # Process Chon Ji (9th keup)
     chon_ji_file = patterns_dir / "9th_keup_patterns.json"
@@ -253,9 +245,9 @@ def main():
     print(f"Total corrections applied: {len(corrector.corrections_applied)}")
     
     if corrector.corrections_applied:
-        print(f"\nAll corrections:")
-        for correction in corrector.corrections_applied:
-            print(f"  Move {correction['move']}: {correction['field']} - {correction['old']} → {correction['new']}")
+        lines = ["\nAll corrections:"]
+        lines.extend(_format_correction(correction) for correction in corrector.corrections_applied)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Shared JSON I/O helpers for the TKDojang content maintenance scripts.
+
+Uses orjson when it is installed (parse/serialize run in C) and falls back to
+the standard library otherwise. Output is byte-identical either way: 2-space
+indent, UTF-8, non-ASCII characters (hangul) left unescaped.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+PathLike = Union[str, Path]
+
+
+def loads(buf: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def load_json(path: PathLike) -> Any:
+    """Read and parse a JSON file in a single read."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def load_json_mapped(path: PathLike) -> Any:
+    """
+    Parse a JSON file through a read-only memory map.
+
+    orjson parses straight out of the mapped pages, so large files are never
+    copied into a separate bytes object first. Without orjson (or for an
+    empty file, which cannot be mapped) this falls back to load_json.
+    """
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def dump_indent2(data: Any, trailing_newline: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes matching json.dump(indent=2, ensure_ascii=False)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if trailing_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, option=option)
+
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    if trailing_newline:
+        text += '\n'
+    return text.encode('utf-8')
+
+
+def atomic_write_bytes(path: PathLike, buf: bytes) -> None:
+    """
+    Write buf to path with one bulk write, atomically.
+
+    The bytes go to a sibling ``.tmp`` file which is then renamed over the
+    target, so an interrupted run never leaves a half-written content file.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+class StatCache:
+    """
+    Remembers the (mtime_ns, size) of files a script has already processed.
+
+    Stored as a small JSON sidecar so re-runs over an unchanged tree can skip
+    files without opening them. The cache is discarded whenever the owning
+    script's source changes, so edited rules always re-check every file.
+    Delete the sidecar to force a full run.
+    """
+
+    def __init__(self, cache_path: PathLike, script_path: PathLike):
+        self.cache_path = Path(cache_path)
+        self.fingerprint = hashlib.sha256(Path(script_path).read_bytes()).hexdigest()
+        self.entries = {}
+        self._lock = threading.Lock()
+
+        try:
+            stored = load_json(self.cache_path)
+        except (OSError, ValueError):
+            stored = None
+        if isinstance(stored, dict) and stored.get('fingerprint') == self.fingerprint:
+            self.entries = stored.get('files', {})
+
+    @staticmethod
+    def _signature(path: PathLike) -> list:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+
+    def is_unchanged(self, path: PathLike) -> bool:
+        """True if path still matches the signature recorded on the last run."""
+        try:
+            return self.entries.get(str(path)) == self._signature(path)
+        except OSError:
+            return False
+
+    def record(self, path: PathLike) -> None:
+        """Record path's current signature (call after any rewrite)."""
+        signature = self._signature(path)
+        with self._lock:
+            self.entries[str(path)] = signature
+
+    def save(self) -> None:
+        payload = {'fingerprint': self.fingerprint, 'files': self.entries}
+        atomic_write_bytes(self.cache_path, dump_indent2(payload, trailing_newline=True))
@@ -8,11 +8,52 @@ Ensures consistent title casing for:
 - Vocabulary files: english, romanised properties
 """
 
-import json
+import functools
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, repeat
 from pathlib import Path
 
+from content_io import StatCache, atomic_write_bytes, dump_indent2, load_json
+
+# Files are independent, so they are fixed concurrently; file reads and
+# writes release the GIL. The lock keeps report lines from interleaving.
+MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+_print_lock = threading.Lock()
+
+# Files unchanged since the last run are skipped without being parsed
+CACHE_PATH = Path(__file__).parent / '.title-case-cache.json'
+
+# Small words that should be lowercase (unless first word)
+SMALL_WORDS = frozenset({'of', 'the', 'a', 'an', 'and', 'or', 'to', 'in', 'with'})
+
+# Hyphenated compounds (e.g., "3-step", "w-shape")
+HYPHEN_RE = re.compile(r'\b[\w]+-[\w]+\b')
+
+# Strings to_title_case would return unchanged: single-spaced ASCII words,
+# first word capitalized, later words either a lowercase small word or
+# capitalized and not a small word. No hyphens or parentheses, which take
+# the slow path. Most strings are already canonical on re-runs.
+_SMALL_WORDS_ALT = '|'.join(sorted(SMALL_WORDS))
+ALREADY_TITLE_RE = re.compile(
+    rf"[A-Z][a-z0-9']*"
+    rf"(?: (?:(?:{_SMALL_WORDS_ALT})|(?!(?i:{_SMALL_WORDS_ALT})\b)[A-Z][A-Za-z0-9']*))*"
+)
+
+
+def _title_case_hyphenated(match):
+    """Capitalize each part of a hyphenated compound ("3-step" → "3-Step")."""
+    return '-'.join(part.capitalize() for part in match.group(0).split('-'))
+
+
+def _title_case_parenthetical(word):
+    """Capitalize before the paren, lowercase inside it (unless proper noun)."""
+    open_idx = word.index('(')
+    close_idx = word.index(')')
+    return f"{word[:open_idx].capitalize()}({word[open_idx + 1:close_idx].lower()}){word[close_idx + 1:]}"
+
 
 def to_title_case(text):
     """
@@ -27,45 +68,47 @@ def to_title_case(text):
     if not text or not isinstance(text, str):
         return text
 
-    # Handle hyphenated compounds (e.g., "3-step" → "3-Step", "w-shape" → "W-Shape")
-    def title_case_hyphenated(match):
-        parts = match.group(0).split('-')
-        return '-'.join(p.capitalize() for p in parts)
+    if ALREADY_TITLE_RE.fullmatch(text):
+        return text
 
+    return _to_title_case(text)
+
+
+# Terms repeat heavily across files ("Punch", "Block", "Stance"), so
+# memoize the string work. Kept separate from to_title_case because JSON
+# values may be unhashable (lists/dicts) and must pass through untouched.
+@functools.lru_cache(maxsize=4096)
+def _to_title_case(text):
+    """Title case a non-empty string (see to_title_case for the rules)."""
     # First pass: handle hyphenated words
-    text = re.sub(r'\b[\w]+-[\w]+\b', title_case_hyphenated, text)
+    text = HYPHEN_RE.sub(_title_case_hyphenated, text)
 
     # Split into words
     words = text.split()
     if not words:
         return text
 
-    # Small words that should be lowercase (unless first word)
-    small_words = {'of', 'the', 'a', 'an', 'and', 'or', 'to', 'in', 'with'}
-
-    # Title case each word, with exceptions
-    result = []
-    for i, word in enumerate(words):
-        # Handle parentheticals
+    # First word is always capitalized (unless it's already hyphenated)
+    first = words[0]
+    if '(' in first and ')' in first:
+        result = [_title_case_parenthetical(first)]
+    elif '-' in first:
+        result = [first]  # Already handled by hyphen logic
+    else:
+        result = [first.capitalize()]
+
+    # Title case remaining words, with exceptions
+    for word in islice(words, 1, None):
         if '(' in word and ')' in word:
-            # Extract parts
-            before_paren = word[:word.index('(')]
-            in_paren = word[word.index('(')+1:word.index(')')]
-            after_paren = word[word.index(')')+1:] if word.index(')') < len(word)-1 else ''
-
-            # Capitalize before paren, lowercase inside paren (unless proper noun)
-            result.append(f"{before_paren.capitalize()}({in_paren.lower()}){after_paren}")
-        # First word is always capitalized (unless it's already hyphenated)
-        elif i == 0:
-            if '-' not in word:
-                result.append(word.capitalize())
-            else:
-                result.append(word)  # Already handled by hyphen logic
+            result.append(_title_case_parenthetical(word))
+            continue
+
         # Small prepositions/articles stay lowercase (unless first word)
-        elif word.lower() in small_words:
-            result.append(word.lower())
+        lower = word.lower()
+        if lower in SMALL_WORDS:
+            result.append(lower)
         # Keep words that are already title-cased or have hyphens
-        elif '-' in word or word[0].isupper():
+        elif word[0].isupper() or '-' in word:
             result.append(word)
         else:
             result.append(word.capitalize())
@@ -73,10 +116,28 @@ def to_title_case(text):
     return ' '.join(result)
 
 
-def fix_terminology_file(filepath):
+def list_json_files(directory):
+    """List *.json files in directory sorted by name, using scandir's cached dirents."""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda e: e.name)
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
+
+
+def report_change(filepath, original, fixed):
+    """Print a single title-case change without interleaving across threads."""
+    with _print_lock:
+        print(f"  {filepath.name}: '{original}' → '{fixed}'")
+
+
+def fix_terminology_file(filepath, cache=None):
     """Fix title casing in terminology JSON files."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if cache is not None and cache.is_unchanged(filepath):
+        return False
+
+    data = load_json(filepath)
 
     changed = False
 
@@ -88,7 +149,7 @@ def fix_terminology_file(filepath):
                 original = term['english']
                 fixed = to_title_case(original)
                 if original != fixed:
-                    print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                    report_change(filepath, original, fixed)
                     term['english'] = fixed
                     changed = True
 
@@ -97,22 +158,25 @@ def fix_terminology_file(filepath):
                 original = term['romanised']
                 fixed = to_title_case(original)
                 if original != fixed:
-                    print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                    report_change(filepath, original, fixed)
                     term['romanised'] = fixed
                     changed = True
 
     if changed:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        atomic_write_bytes(filepath, dump_indent2(data, trailing_newline=True))
+
+    if cache is not None:
+        cache.record(filepath)
 
     return changed
 
 
-def fix_techniques_file(filepath):
+def fix_techniques_file(filepath, cache=None):
     """Fix title casing in techniques JSON files."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if cache is not None and cache.is_unchanged(filepath):
+        return False
+
+    data = load_json(filepath)
 
     changed = False
 
@@ -126,7 +190,7 @@ def fix_techniques_file(filepath):
                     original = technique['names']['english']
                     fixed = to_title_case(original)
                     if original != fixed:
-                        print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                        report_change(filepath, original, fixed)
                         technique['names']['english'] = fixed
                         changed = True
 
@@ -135,22 +199,25 @@ def fix_techniques_file(filepath):
                     original = technique['names']['romanised']
                     fixed = to_title_case(original)
                     if original != fixed:
-                        print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                        report_change(filepath, original, fixed)
                         technique['names']['romanised'] = fixed
                         changed = True
 
     if changed:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        atomic_write_bytes(filepath, dump_indent2(data, trailing_newline=True))
+
+    if cache is not None:
+        cache.record(filepath)
 
     return changed
 
 
-def fix_vocabulary_file(filepath):
+def fix_vocabulary_file(filepath, cache=None):
     """Fix title casing in vocabulary_words.json file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if cache is not None and cache.is_unchanged(filepath):
+        return False
+
+    data = load_json(filepath)
 
     changed = False
 
@@ -162,7 +229,7 @@ def fix_vocabulary_file(filepath):
                 original = word['english']
                 fixed = to_title_case(original)
                 if original != fixed:
-                    print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                    report_change(filepath, original, fixed)
                     word['english'] = fixed
                     changed = True
 
@@ -171,14 +238,15 @@ def fix_vocabulary_file(filepath):
                 original = word['romanised']
                 fixed = to_title_case(original)
                 if original != fixed:
-                    print(f"  {filepath.name}: '{original}' → '{fixed}'")
+                    report_change(filepath, original, fixed)
                     word['romanised'] = fixed
                     changed = True
 
     if changed:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        atomic_write_bytes(filepath, dump_indent2(data, trailing_newline=True))
+
+    if cache is not None:
+        cache.record(filepath)
 
     return changed
 
@@ -188,30 +256,32 @@ def main():
     base_path = Path(__file__).parent.parent / 'TKDojang' / 'Sources' / 'Core' / 'Data' / 'Content'
 
     total_changed = 0
-
-    # Process Terminology files
-    print("📚 Processing Terminology files...")
-    terminology_path = base_path / 'Terminology'
-    if terminology_path.exists():
-        for filepath in sorted(terminology_path.glob('*.json')):
-            if fix_terminology_file(filepath):
-                total_changed += 1
-
-    # Process Techniques files
-    print("\n🥋 Processing Techniques files...")
-    techniques_path = base_path / 'Techniques'
-    if techniques_path.exists():
-        for filepath in sorted(techniques_path.glob('*.json')):
-            if fix_techniques_file(filepath):
-                total_changed += 1
+    cache = StatCache(CACHE_PATH, __file__)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Process Terminology files
+        print("📚 Processing Terminology files...")
+        terminology_path = base_path / 'Terminology'
+        if terminology_path.exists():
+            filepaths = list_json_files(terminology_path)
+            total_changed += sum(executor.map(fix_terminology_file, filepaths, repeat(cache)))
+
+        # Process Techniques files
+        print("\n🥋 Processing Techniques files...")
+        techniques_path = base_path / 'Techniques'
+        if techniques_path.exists():
+            filepaths = list_json_files(techniques_path)
+            total_changed += sum(executor.map(fix_techniques_file, filepaths, repeat(cache)))
 
     # Process Vocabulary file
     print("\n📖 Processing Vocabulary file...")
     vocabulary_path = base_path / 'VocabularyBuilder' / 'vocabulary_words.json'
     if vocabulary_path.exists():
-        if fix_vocabulary_file(vocabulary_path):
+        if fix_vocabulary_file(vocabulary_path, cache):
             total_changed += 1
 
+    cache.save()
+
     print(f"\n✅ Complete! {total_changed} files modified")
 
 
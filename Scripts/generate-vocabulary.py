@@ -1,10 +1,80 @@
 #!/usr/bin/env python3
 """Generate vocabulary from English ↔ Korean romanized mappings"""
 
-import json
-from collections import defaultdict
+import os
+from collections import Counter, defaultdict
 from pathlib import Path
 
+from content_io import dump_indent2, load_json
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files at least this large are streamed with ijson (when installed) rather
+# than decoded whole
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+if msgspec is not None:
+    class Term(msgspec.Struct):
+        """The three term fields the vocabulary needs; all others are skipped."""
+        english_term: str
+        romanized_pronunciation: str
+        korean_hangul: str
+
+    class TerminologyFile(msgspec.Struct):
+        terminology: list[Term] = []
+
+    _decode_term_list = msgspec.json.Decoder(list[Term]).decode
+    _decode_terminology_file = msgspec.json.Decoder(TerminologyFile).decode
+
+def _is_list_root(head):
+    """Files are either a bare list of terms or {"terminology": [...]}"""
+    return head.lstrip()[:1] == b'['
+
+def _stream_term_dicts(json_file):
+    """Yield terminology entries as dicts, streamed with ijson.
+
+    Peak memory is one term rather than the whole parsed document.
+    """
+    with open(json_file, 'rb') as f:
+        root_is_list = _is_list_root(f.read(64))
+        f.seek(0)
+        yield from ijson.items(f, 'item' if root_is_list else 'terminology.item')
+
+def iter_terms(json_file):
+    """Yield (english, romanized, hangul) for each terminology entry.
+
+    Files of STREAM_THRESHOLD bytes or more are streamed with ijson when it
+    is installed. Smaller files are decoded in one go: with msgspec straight
+    into typed structs holding just these three fields, otherwise as dicts.
+    """
+    if ijson is not None and os.path.getsize(json_file) >= STREAM_THRESHOLD:
+        for term in _stream_term_dicts(json_file):
+            yield term['english_term'], term['romanized_pronunciation'], term['korean_hangul']
+        return
+
+    if msgspec is not None:
+        with open(json_file, 'rb') as f:
+            buf = f.read()
+        if _is_list_root(buf[:64]):
+            terms = _decode_term_list(buf)
+        else:
+            terms = _decode_terminology_file(buf).terminology
+        for term in terms:
+            yield term.english_term, term.romanized_pronunciation, term.korean_hangul
+        return
+
+    data = load_json(json_file)
+    for term in data if isinstance(data, list) else data.get('terminology', []):
+        yield term['english_term'], term['romanized_pronunciation'], term['korean_hangul']
+
 def main():
     # Load all terminology JSON files
     terminology_dir = Path("TKDojang/Sources/Core/Data/Content/Terminology")
@@ -16,46 +86,38 @@ def main():
     total_terms = 0
 
     for json_file in json_files:
-        with open(json_file, encoding='utf-8') as f:
-            data = json.load(f)
+        for english, romanized, hangul in iter_terms(json_file):
+            total_terms += 1
+            english_words = english.split()
+            romanized_words = romanized.split()
 
-        terms = data if isinstance(data, list) else data.get('terminology', [])
-        total_terms += len(terms)
-
-        for term in terms:
-            english_words = term['english_term'].split()
-            romanized_words = term['romanized_pronunciation'].split()
-            hangul = term['korean_hangul']
+            # Store hangul if it has spaces (otherwise it's compound)
+            hangul_words = hangul.split() if ' ' in hangul else ()
 
             # Match word-by-word
-            for eng, rom in zip(english_words, romanized_words):
-                key = eng.lower()
-                word_map[key]["romanized"] = rom  # Use most recent (or could do most common)
-                word_map[key]["count"] += 1
-
-                # Store hangul if it has spaces (otherwise it's compound)
-                if ' ' in hangul:
-                    hangul_words = hangul.split()
-                    # Try to match positionally
-                    idx = english_words.index(eng)
-                    if idx < len(hangul_words):
-                        word_map[key]["hangul_variants"].append(hangul_words[idx])
-
-    # Build vocabulary
-    vocabulary = []
-    for english, data in word_map.items():
+            for idx, (eng, rom) in enumerate(zip(english_words, romanized_words)):
+                entry = word_map[eng.lower()]
+                entry["romanized"] = rom  # Use most recent (or could do most common)
+                entry["count"] += 1
+
+                # Try to match hangul positionally
+                if idx < len(hangul_words):
+                    entry["hangul_variants"].append(hangul_words[idx])
+
+    # Build vocabulary (one slot per unique word, sized up front)
+    vocabulary = [None] * len(word_map)
+    for i, (english, data) in enumerate(word_map.items()):
         # Get most common hangul variant if available
         hangul = None
         if data["hangul_variants"]:
-            hangul = max(set(data["hangul_variants"]),
-                        key=lambda x: data["hangul_variants"].count(x))
+            hangul = Counter(data["hangul_variants"]).most_common(1)[0][0]
 
-        vocabulary.append({
+        vocabulary[i] = {
             "english": english.title(),
             "romanized": data["romanized"],
             "hangul": hangul,
             "frequency": data["count"]
-        })
+        }
 
     # Sort by frequency
     vocabulary.sort(key=lambda x: x['frequency'], reverse=True)
@@ -65,8 +127,8 @@ def main():
     output_path = Path("TKDojang/Sources/Core/Data/Content/VocabularyBuilder/vocabulary_words.json")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(dump_indent2(output))
 
     print(f"✅ Generated {len(vocabulary)} words from {total_terms} terms ({len(json_files)} JSON files)")
     print(f"📝 {output_path}")
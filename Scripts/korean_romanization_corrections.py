@@ -7,123 +7,127 @@ by mapping English technique names to their correct Korean equivalents
 using the terminology reference files.
 """
 
-import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+from content_io import StatCache, atomic_write_bytes, dump_indent2, load_json
+
+# Sidecar recording which pattern files were already corrected by this script
+CACHE_PATH = Path(__file__).parent / '.korean-romanization-cache.json'
+
+# English technique name -> correct Korean romanization, based on the
+# terminology reference files. Built once at import and shared read-only.
+_KOREAN_MAPPING: Mapping[str, str] = MappingProxyType({
+    # Basic punches
+    "Obverse Punch": "Baro Jirugi",
+    "Reverse Punch": "Bandae Jirugi",
+    "High Punch": "Nopunde Jirugi",
+    "Middle Punch": "Kaunde Jirugi",
+    "Low Punch": "Najunde Jirugi",
+    "Upset Punch": "Dwijibo Jirugi",
+    "Twin Vertical Punch": "Sang Sewo Jirugi",
+    "Double Punch": "Doo Jirugi",
+    "Flat Fingertip Thrust": "Opun Sonkut Tulgi",
+    "Straight Fingertip Thrust": "Sun Sonkut Tulgi",
+    "Upset Fingertip Thrust": "Dwijibo Sonkut Tulgi",
+
+    # Basic blocks
+    "Inner Forearm Block": "An Palmok Makgi",
+    "Inner Forearm Middle Block": "An Palmok Kaunde Makgi",
+    "Outer Forearm Block": "Bakat Palmok Makgi",
+    "Outer Forearm Low Block": "Bakat Palmok Najunde Makgi",
+    "Outer Forearm Middle Block": "Bakat Palmok Kaunde Makgi",
+    "Outer Forearm High Block": "Bakat Palmok Nopunde Makgi",
+    "Outer Forearm Middle Inward Block": "Bakat Palmok Kaunde Anaero Makgi",
+    "Twin Outer Forearm Block": "Sang Bakat Palmok Makgi",
+    "Double Forearm Block": "Doo Palmok Makgi",
+    "Forearm Guarding Block": "Palmok Daebi Makgi",
+    "Forearm Rising Block": "Palmok Chookyo Makgi",
+    "Inner Forearm Circular Block": "An Palmok Dollimyo Makgi",
+
+    # Knife hand techniques
+    "Knife Hand Block": "Sonkal Makgi",
+    "Knife Hand Guarding Block": "Sonkal Daebi Makgi",
+    "Knife Hand Strike": "Sonkal Taerigi",
+    "Inward Knife Hand Strike": "Anaero Sonkal Taerigi",
+    "Knife Hand Downward Strike": "Naeryo Sonkal Taerigi",
+    "Reverse Knife Hand Strike": "Bandae Sonkal Taerigi",
+    "Reverse Knife Hand Inward Strike": "Sonkal Dung Anaero Taerigi",
+    "Twin Knife Hand Block": "Sang Sonkal Makgi",
+    "X Knife Hand Checking Block": "Kyocha Sonkal Momchau Makgi",
+
+    # Back fist techniques
+    "Back Fist Strike": "Dung Joomuk Taerigi",
+    "Back Fist Rear Strike": "Dung Joomuk Dwutcha Taerigi",
+    "Back Fist Side Strike": "Dung Joomuk Yop Taerigi",
+    "Back Fist Strike/Outer Forearm Low Block": "Dung Joomuk Taerigi/Bakat Palmok Najunde Makgi",
+
+    # Palm techniques
+    "Palm Pushing Block": "Sonbadak Mireo Makgi",
+    "Twin Palm Upward Block": "Sang Sonbadak Ollyo Makgi",
+    "Twin Upward Palm Block": "Sang Sonbadak Ollyo Makgi",
+
+    # Kicks
+    "Front Kick": "Ap Chagi",
+    "Front Snap Kick": "Ap Cha Busigi",
+    "Side Piercing Kick": "Yop Cha Jirugi",
+    "Side Piercing Kick to Rear": "Dwi Yop Cha Jirugi",
+    "Turning Kick": "Dollyo Chagi",
+    "Reverse Side Kick": "Bandae Yop Chagi",
+    "Flying Side Piercing Kick": "Twimyo Yop Cha Jirugi",
+    "Rising Kick": "Ap Cha Olligi",
+    "Knee Kick": "Moorup Chagi",
+
+    # Special blocks
+    "X-Fist Pressing Block": "Kyocha Joomuk Noollo Makgi",
+    "U-shape Block": "Digutja Makgi",
+    "W Shaped Block": "San Makgi",
+    "Double Forearm Pushing Block": "Doo Palmok Mireo Makgi",
+
+    # Complex techniques
+    "Grab (Opponent's Head)": "Meori Japgi",
+    "Grab to Shoulders": "Eokae Japgi",
+    "Release Move": "Nohgi",
+    "Posture Move": "Jasei Dongjak",
+    "Flying Side Piercing Kick / Knife Hand Guarding Block": "Twimyo Yop Cha Jirugi/Sonkal Daebi Makgi",
+    "Back Fist Strike / Outer Forearm Low Block": "Dung Joomuk Taerigi/Bakat Palmok Najunde Makgi",
+    "Front Outer Forearm Block / Back Fist Side Strike": "Ap Bakat Palmok Makgi/Dung Joomuk Yop Taerigi",
+    "Inner Forearm Block / Outer Forearm Block": "An Palmok Makgi/Bakat Palmok Makgi",
+    "Jump 360 to Knife Hand Guarding Block": "360 Twimyo Sonkal Daebi Makgi",
+
+    # Elbow techniques
+    "Side Elbow Thrust": "Yop Palkup Taerigi",
+})
+
+# (english, korean) pairs that are already correct, so the common case of a
+# move needing no change costs a single set lookup
+_CORRECT_PAIRS = frozenset(_KOREAN_MAPPING.items())
+
+
+def _correct_file(pattern_file_path: str) -> Tuple[bool, bool, List[Dict[str, Any]], List[str]]:
+    """
+    Worker for process_all_patterns: correct one file in a pool process.
+
+    Returns (success, updated, corrections, report) so the parent can merge
+    results, print each file's report in order and cache only successes.
+    """
+    corrector = KoreanRomanizationCorrector()
+    updated, report = corrector.correct_korean_romanizations(pattern_file_path)
+    return updated is not None, bool(updated), corrector.corrections_applied, report
+
 
 class KoreanRomanizationCorrector:
+    __slots__ = ('korean_mapping', 'corrections_applied')
+    
     def __init__(self):
-        # Build Korean mapping from terminology files
-        self.korean_mapping = self._build_korean_mapping()
+        self.korean_mapping = _KOREAN_MAPPING
         self.corrections_applied = []
-        
-    def _build_korean_mapping(self) -> Dict[str, str]:
-        """Build mapping of English techniques to Korean romanizations from terminology files"""
-        mapping = {}
-        
-        # Define technique mappings based on terminology analysis
-        # Basic punches
-        mapping.update({
-            "Obverse Punch": "Baro Jirugi",
-            "Reverse Punch": "Bandae Jirugi",
-            "High Punch": "Nopunde Jirugi",
-            "Middle Punch": "Kaunde Jirugi",
-            "Low Punch": "Najunde Jirugi",
-            "Upset Punch": "Dwijibo Jirugi",
-            "Twin Vertical Punch": "Sang Sewo Jirugi",
-            "Double Punch": "Doo Jirugi",
-            "Flat Fingertip Thrust": "Opun Sonkut Tulgi",
-            "Straight Fingertip Thrust": "Sun Sonkut Tulgi",
-            "Upset Fingertip Thrust": "Dwijibo Sonkut Tulgi"
-        })
-        
-        # Basic blocks
-        mapping.update({
-            "Inner Forearm Block": "An Palmok Makgi",
-            "Inner Forearm Middle Block": "An Palmok Kaunde Makgi",
-            "Outer Forearm Block": "Bakat Palmok Makgi",
-            "Outer Forearm Low Block": "Bakat Palmok Najunde Makgi",
-            "Outer Forearm Middle Block": "Bakat Palmok Kaunde Makgi",
-            "Outer Forearm High Block": "Bakat Palmok Nopunde Makgi",
-            "Outer Forearm Middle Inward Block": "Bakat Palmok Kaunde Anaero Makgi",
-            "Twin Outer Forearm Block": "Sang Bakat Palmok Makgi",
-            "Double Forearm Block": "Doo Palmok Makgi",
-            "Forearm Guarding Block": "Palmok Daebi Makgi",
-            "Forearm Rising Block": "Palmok Chookyo Makgi",
-            "Inner Forearm Circular Block": "An Palmok Dollimyo Makgi"
-        })
-        
-        # Knife hand techniques
-        mapping.update({
-            "Knife Hand Block": "Sonkal Makgi",
-            "Knife Hand Guarding Block": "Sonkal Daebi Makgi", 
-            "Knife Hand Strike": "Sonkal Taerigi",
-            "Inward Knife Hand Strike": "Anaero Sonkal Taerigi",
-            "Knife Hand Downward Strike": "Naeryo Sonkal Taerigi",
-            "Reverse Knife Hand Strike": "Bandae Sonkal Taerigi",
-            "Reverse Knife Hand Inward Strike": "Sonkal Dung Anaero Taerigi",
-            "Twin Knife Hand Block": "Sang Sonkal Makgi",
-            "X Knife Hand Checking Block": "Kyocha Sonkal Momchau Makgi"
-        })
-        
-        # Back fist techniques
-        mapping.update({
-            "Back Fist Strike": "Dung Joomuk Taerigi",
-            "Back Fist Rear Strike": "Dung Joomuk Dwutcha Taerigi",
-            "Back Fist Side Strike": "Dung Joomuk Yop Taerigi",
-            "Back Fist Strike/Outer Forearm Low Block": "Dung Joomuk Taerigi/Bakat Palmok Najunde Makgi"
-        })
-        
-        # Palm techniques  
-        mapping.update({
-            "Palm Pushing Block": "Sonbadak Mireo Makgi",
-            "Twin Palm Upward Block": "Sang Sonbadak Ollyo Makgi",
-            "Twin Upward Palm Block": "Sang Sonbadak Ollyo Makgi"
-        })
-        
-        # Kicks
-        mapping.update({
-            "Front Kick": "Ap Chagi",
-            "Front Snap Kick": "Ap Cha Busigi",
-            "Side Piercing Kick": "Yop Cha Jirugi", 
-            "Side Piercing Kick to Rear": "Dwi Yop Cha Jirugi",
-            "Turning Kick": "Dollyo Chagi",
-            "Reverse Side Kick": "Bandae Yop Chagi",
-            "Flying Side Piercing Kick": "Twimyo Yop Cha Jirugi",
-            "Rising Kick": "Ap Cha Olligi",
-            "Knee Kick": "Moorup Chagi"
-        })
-        
-        # Special blocks
-        mapping.update({
-            "X-Fist Pressing Block": "Kyocha Joomuk Noollo Makgi",
-            "U-shape Block": "Digutja Makgi",
-            "W Shaped Block": "San Makgi",
-            "Double Forearm Pushing Block": "Doo Palmok Mireo Makgi"
-        })
-        
-        # Complex techniques
-        mapping.update({
-            "Grab (Opponent's Head)": "Meori Japgi",
-            "Grab to Shoulders": "Eokae Japgi",
-            "Release Move": "Nohgi",
-            "Posture Move": "Jasei Dongjak",
-            "Flying Side Piercing Kick / Knife Hand Guarding Block": "Twimyo Yop Cha Jirugi/Sonkal Daebi Makgi",
-            "Back Fist Strike / Outer Forearm Low Block": "Dung Joomuk Taerigi/Bakat Palmok Najunde Makgi",
-            "Front Outer Forearm Block / Back Fist Side Strike": "Ap Bakat Palmok Makgi/Dung Joomuk Yop Taerigi",
-            "Inner Forearm Block / Outer Forearm Block": "An Palmok Makgi/Bakat Palmok Makgi",
-            "Jump 360 to Knife Hand Guarding Block": "360 Twimyo Sonkal Daebi Makgi"
-        })
-        
-        # Elbow techniques
-        mapping.update({
-            "Side Elbow Thrust": "Yop Palkup Taerigi"
-        })
-        
-        return mapping
     
-    def correct_korean_romanizations(self, pattern_file_path: str) -> bool:
+    def correct_korean_romanizations(self, pattern_file_path: str) -> Tuple[Optional[bool], List[str]]:
         """
         Correct Korean romanizations in a pattern file
         
@@ -131,11 +135,13 @@ class KoreanRomanizationCorrector:
             pattern_file_path: Path to pattern JSON file
             
         Returns:
-            bool: True if corrections were made, False otherwise
+            (bool, list): True if corrections were made, False otherwise (None
+            if the file could not be processed), and the newline-terminated
+            report lines for this file
         """
+        report = []
         try:
-            with open(pattern_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(pattern_file_path)
             
             corrections_made = False
             file_corrections = []
@@ -146,50 +152,49 @@ class KoreanRomanizationCorrector:
                 
                 # Process each move in the pattern
                 for move in pattern.get('moves', []):
-                    move_number = move.get('move_number', 0)
                     english_technique = move.get('technique', '')
                     current_korean = move.get('korean_technique', '')
                     
+                    # Skip moves whose Korean is already correct
+                    if (english_technique, current_korean) in _CORRECT_PAIRS:
+                        continue
+                    
                     # Check if we have a better Korean romanization
-                    if english_technique in self.korean_mapping:
-                        correct_korean = self.korean_mapping[english_technique]
+                    correct_korean = self.korean_mapping.get(english_technique)
+                    if correct_korean is not None:
+                        old_korean = current_korean
+                        move['korean_technique'] = correct_korean
+                        corrections_made = True
                         
-                        # Only update if current Korean is different
-                        if current_korean != correct_korean:
-                            old_korean = current_korean
-                            move['korean_technique'] = correct_korean
-                            corrections_made = True
-                            
-                            correction_info = {
-                                'pattern': pattern_name,
-                                'move': move_number,
-                                'english_technique': english_technique,
-                                'old_korean': old_korean,
-                                'new_korean': correct_korean
-                            }
-                            file_corrections.append(correction_info)
+                        correction_info = {
+                            'pattern': pattern_name,
+                            'move': move.get('move_number', 0),
+                            'english_technique': english_technique,
+                            'old_korean': old_korean,
+                            'new_korean': correct_korean
+                        }
+                        file_corrections.append(correction_info)
             
             # Write back if corrections were made
             if corrections_made:
-                with open(pattern_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                atomic_write_bytes(pattern_file_path, dump_indent2(data))
                 
                 self.corrections_applied.extend(file_corrections)
-                print(f"✓ Updated {len(file_corrections)} Korean romanizations in {os.path.basename(pattern_file_path)}")
+                report.append(f"✓ Updated {len(file_corrections)} Korean romanizations in {os.path.basename(pattern_file_path)}\n")
                 
-                # Print detailed corrections
+                # Report detailed corrections
                 for correction in file_corrections:
-                    print(f"  Move {correction['move']}: {correction['english_technique']}")
-                    print(f"    Old: {correction['old_korean']}")
-                    print(f"    New: {correction['new_korean']}")
+                    report.append(f"  Move {correction['move']}: {correction['english_technique']}\n")
+                    report.append(f"    Old: {correction['old_korean']}\n")
+                    report.append(f"    New: {correction['new_korean']}\n")
             else:
-                print(f"  No Korean corrections needed in {os.path.basename(pattern_file_path)}")
+                report.append(f"  No Korean corrections needed in {os.path.basename(pattern_file_path)}\n")
             
-            return corrections_made
+            return corrections_made, report
             
         except Exception as e:
-            print(f"❌ Error processing {pattern_file_path}: {e}")
-            return False
+            report.append(f"❌ Error processing {pattern_file_path}: {e}\n")
+            return None, report
     
     def process_all_patterns(self, patterns_directory: str) -> None:
         """Process all pattern files in the directory"""
@@ -211,17 +216,34 @@ class KoreanRomanizationCorrector:
         total_files_updated = 0
         total_corrections = 0
         
-        # Process each pattern file
-        for pattern_file in sorted(pattern_files):
-            print(f"\nProcessing {pattern_file.name}...")
-            corrections_before = len(self.corrections_applied)
+        # Skip files untouched since the last run, correct the rest in
+        # parallel and merge the results back here in sorted order
+        pattern_files = sorted(pattern_files)
+        cache = StatCache(CACHE_PATH, __file__)
+        pending = [pattern_file for pattern_file in pattern_files if not cache.is_unchanged(pattern_file)]
+        with ProcessPoolExecutor() as executor:
+            results = dict(zip(pending, executor.map(_correct_file, map(str, pending), chunksize=4)))
+        
+        for pattern_file in pattern_files:
+            if pattern_file not in results:
+                sys.stdout.write(f"\nProcessing {pattern_file.name}...\n"
+                                 f"  Unchanged since last run, skipping {pattern_file.name}\n")
+                continue
             
-            if self.correct_korean_romanizations(str(pattern_file)):
+            # One write per file rather than one print per correction line
+            success, updated, file_corrections, report = results[pattern_file]
+            sys.stdout.write(f"\nProcessing {pattern_file.name}...\n" + ''.join(report))
+            
+            if updated:
                 total_files_updated += 1
             
-            corrections_after = len(self.corrections_applied)
-            file_corrections = corrections_after - corrections_before
-            total_corrections += file_corrections
+            self.corrections_applied.extend(file_corrections)
+            total_corrections += len(file_corrections)
+            # Failed files stay uncached so the next run retries them
+            if success:
+                cache.record(pattern_file)
+        
+        cache.save()
         
         # Print summary
         print(f"\n{'='*60}")
@@ -232,10 +254,12 @@ class KoreanRomanizationCorrector:
         print(f"Total Korean corrections applied: {total_corrections}")
         
         if self.corrections_applied:
-            print(f"\nDetailed corrections:")
+            # Buffer the (potentially long) detail listing into one write
+            lines = ["\nDetailed corrections:"]
             for correction in self.corrections_applied:
-                print(f"  {correction['pattern']} Move {correction['move']}: {correction['english_technique']}")
-                print(f"    {correction['old_korean']} → {correction['new_korean']}")
+                lines.append(f"  {correction['pattern']} Move {correction['move']}: {correction['english_technique']}")
+                lines.append(f"    {correction['old_korean']} → {correction['new_korean']}")
+            sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     """Main function to run Korean romanization corrections"""
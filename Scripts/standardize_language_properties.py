@@ -12,25 +12,68 @@ This script preserves existing JSON structure (nesting levels) and only renames
 Missing fields are omitted entirely (no null/empty values).
 """
 
-import json
 import hashlib
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Tuple
 from collections import defaultdict
 
+from content_io import StatCache, atomic_write_bytes, dump_indent2, loads
+
+# Sidecar recording which content files were already standardized by this script
+CACHE_PATH = Path(__file__).parent / '.language-properties-cache.json'
+
+# Content subdirectory name -> file type handled by the standardizer
+_TYPE_BY_SEGMENT = {
+    'Terminology': 'terminology',
+    'Techniques': 'techniques',
+    'LineWork': 'linework',
+    'Patterns': 'patterns',
+    'StepSparring': 'stepsparring',
+    'Theory': 'theory',
+    'VocabularyBuilder': 'vocabulary',
+}
+
+# Theory content arrays that standardize_theory handles explicitly
+_THEORY_KNOWN_KEYS = frozenset({'tenets', 'greeting_terms'})
+
+
+def _process_one(args: Tuple[Path, Path, bool, bool]) -> Tuple[bool, str, Dict[str, int], List[str]]:
+    """
+    Worker for process_all: standardize one file in a pool process.
+
+    Returns (success, message, stats, changes_log) for the parent to merge.
+    """
+    content_dir, file_path, dry_run, verbose = args
+    standardizer = LanguagePropertyStandardizer(content_dir, dry_run=dry_run, verbose=verbose)
+    success, message = standardizer.process_file(file_path)
+    return success, message, dict(standardizer.stats), standardizer.changes_log
+
 
 class LanguagePropertyStandardizer:
     """Standardizes language property names while preserving JSON structure."""
 
+    __slots__ = ('content_dir', 'dry_run', 'verbose', 'stats', 'changes_log', '_dispatch')
+
     def __init__(self, content_dir: Path, dry_run: bool = False, verbose: bool = False):
         self.content_dir = content_dir
         self.dry_run = dry_run
         self.verbose = verbose
         self.stats = defaultdict(int)
         self.changes_log = []
+        self._dispatch = {
+            'terminology': self.standardize_terminology,
+            'techniques': self.standardize_techniques,
+            'linework': self.standardize_linework,
+            'patterns': self.standardize_patterns,
+            'stepsparring': self.standardize_stepsparring,
+            'theory': self.standardize_theory,
+            'vocabulary': self.standardize_vocabulary,
+        }
 
-    def standardize_terminology(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def standardize_terminology(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize Terminology files (root-level properties in terminology array)."""
         mapping = {
             'english_term': 'english',
@@ -40,12 +83,11 @@ class LanguagePropertyStandardizer:
         }
 
         if 'terminology' in data:
-            for term in data['terminology']:
-                self._rename_keys(term, mapping)
+            return self._rename_all(data['terminology'], mapping)
 
-        return data
+        return 0, 0
 
-    def standardize_techniques(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def standardize_techniques(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize Techniques files (nested in 'names' object)."""
         mapping = {
             'korean_romanized': 'romanised',
@@ -55,20 +97,22 @@ class LanguagePropertyStandardizer:
         }
 
         if 'techniques' in data:
-            for technique in data['techniques']:
-                if 'names' in technique:
-                    self._rename_keys(technique['names'], mapping)
+            return self._rename_all(
+                (technique['names'] for technique in data['techniques'] if 'names' in technique),
+                mapping
+            )
 
-        return data
+        return 0, 0
 
-    def standardize_linework(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def standardize_linework(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize LineWork files (techniques array)."""
         # Already uses correct naming (english, romanised, hangul)
         # No changes needed - British spelling already present!
-        return data
+        return 0, 0
 
-    def standardize_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def standardize_patterns(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize Patterns files (multiple nesting levels)."""
+        renamed = removed = 0
 
         if 'patterns' in data:
             for pattern in data['patterns']:
@@ -78,7 +122,9 @@ class LanguagePropertyStandardizer:
                     'pronunciation': 'romanised'
                     # 'hangul' and 'phonetic' already correct
                 }
-                self._rename_keys(pattern, pattern_mapping)
+                r, e = self._rename_keys(pattern, pattern_mapping)
+                renamed += r
+                removed += e
 
                 # Move level mappings
                 if 'moves' in pattern:
@@ -86,12 +132,13 @@ class LanguagePropertyStandardizer:
                         'technique': 'english',
                         'korean_technique': 'romanised'
                     }
-                    for move in pattern['moves']:
-                        self._rename_keys(move, move_mapping)
+                    r, e = self._rename_all(pattern['moves'], move_mapping)
+                    renamed += r
+                    removed += e
 
-        return data
+        return renamed, removed
 
-    def standardize_stepsparring(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def standardize_stepsparring(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize StepSparring files (action objects)."""
         action_mapping = {
             'technique': 'english',
@@ -99,23 +146,26 @@ class LanguagePropertyStandardizer:
         }
 
         if 'sequences' in data:
-            for sequence in data['sequences']:
-                if 'steps' in sequence:
-                    for step in sequence['steps']:
-                        # Standardize attack, defense, counter actions
-                        for action_type in ['attack', 'defense', 'counter']:
-                            if action_type in step and step[action_type]:
-                                self._rename_keys(step[action_type], action_mapping)
-
-        return data
-
-    def standardize_theory(self, data: Dict[str, Any]) -> Dict[str, Any]:
+            # Standardize attack, defense, counter actions
+            return self._rename_all(
+                (step[action_type]
+                 for sequence in data['sequences'] if 'steps' in sequence
+                 for step in sequence['steps']
+                 for action_type in ['attack', 'defense', 'counter']
+                 if action_type in step and step[action_type]),
+                action_mapping
+            )
+
+        return 0, 0
+
+    def standardize_theory(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize Theory files (various nested locations)."""
         mapping = {
             'name': 'english',
             'korean': 'romanised'
             # 'english' already correct where used
         }
+        renamed = removed = 0
 
         # Handle theory_sections
         if 'theory_sections' in data:
@@ -125,24 +175,31 @@ class LanguagePropertyStandardizer:
 
                     # Handle tenets
                     if 'tenets' in content:
-                        for tenet in content['tenets']:
-                            self._rename_keys(tenet, mapping)
+                        r, e = self._rename_all(content['tenets'], mapping)
+                        renamed += r
+                        removed += e
 
                     # Handle greeting_terms
                     if 'greeting_terms' in content:
-                        for term in content['greeting_terms']:
-                            self._rename_keys(term, mapping)
+                        r, e = self._rename_all(content['greeting_terms'], mapping)
+                        renamed += r
+                        removed += e
 
                     # Handle other arrays that might have language properties
+                    # (tenets and greeting_terms were already handled above)
                     for key, value in content.items():
-                        if isinstance(value, list):
-                            for item in value:
-                                if isinstance(item, dict):
-                                    self._rename_keys(item, mapping)
-
-        return data
-
-    def standardize_vocabulary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+                        if key in _THEORY_KNOWN_KEYS or type(value) is not list:
+                            continue
+                        r, e = self._rename_all(
+                            (item for item in value if type(item) is dict),
+                            mapping
+                        )
+                        renamed += r
+                        removed += e
+
+        return renamed, removed
+
+    def standardize_vocabulary(self, data: Dict[str, Any]) -> Tuple[int, int]:
         """Standardize VocabularyBuilder files."""
         mapping = {
             'romanized': 'romanised'
@@ -150,56 +207,58 @@ class LanguagePropertyStandardizer:
         }
 
         if 'words' in data:
-            for word in data['words']:
-                self._rename_keys(word, mapping)
+            return self._rename_all(data['words'], mapping)
+
+        return 0, 0
+
+    def _rename_all(self, objs: Iterable[Dict[str, Any]], mapping: Dict[str, str]) -> Tuple[int, int]:
+        """Apply _rename_keys to each object, returning summed (renamed, removed) counts."""
+        renamed = removed = 0
+        for obj in objs:
+            r, e = self._rename_keys(obj, mapping)
+            renamed += r
+            removed += e
+        return renamed, removed
 
-        return data
+    def _rename_keys(self, obj: Dict[str, Any], mapping: Dict[str, str], context: str = "") -> Tuple[int, int]:
+        """
+        Rename keys in-place according to mapping. Omit fields with empty values.
+
+        Returns:
+            (properties renamed, empty fields removed)
+        """
+        # Most objects are already standardized: one C-level set check skips them
+        if obj.keys().isdisjoint(mapping):
+            return 0, 0
 
-    def _rename_keys(self, obj: Dict[str, Any], mapping: Dict[str, str], context: str = "") -> None:
-        """Rename keys in-place according to mapping. Omit fields with empty values."""
-        keys_to_rename = []
+        renamed = removed = 0
         for old_key, new_key in mapping.items():
-            if old_key in obj:
-                value = obj[old_key]
-                # Only include if value is non-empty
-                if value and value != "":
-                    keys_to_rename.append((old_key, new_key, value))
-                else:
-                    # Remove empty values
-                    del obj[old_key]
-                    self.stats['empty_fields_removed'] += 1
-                    if self.verbose:
-                        self.changes_log.append(f"  {context}: removed empty field '{old_key}'")
-
-        # Apply renamings
-        for old_key, new_key, value in keys_to_rename:
-            if old_key != new_key:  # Only rename if actually different
+            if old_key not in obj:
+                continue
+
+            value = obj[old_key]
+            if not value:
+                # Remove empty values
+                del obj[old_key]
+                removed += 1
+                if self.verbose:
+                    self.changes_log.append(f"  {context}: removed empty field '{old_key}'")
+            elif old_key != new_key:  # Only rename if actually different
                 obj[new_key] = value
                 del obj[old_key]
-                self.stats['properties_renamed'] += 1
+                renamed += 1
                 if self.verbose:
                     self.changes_log.append(f"  {context}: {old_key} → {new_key}")
 
+        return renamed, removed
+
     def detect_file_type(self, file_path: Path) -> str:
         """Detect file type based on path pattern."""
-        path_str = str(file_path)
-
-        if '/Terminology/' in path_str:
-            return 'terminology'
-        elif '/Techniques/' in path_str:
-            return 'techniques'
-        elif '/LineWork/' in path_str:
-            return 'linework'
-        elif '/Patterns/' in path_str:
-            return 'patterns'
-        elif '/StepSparring/' in path_str:
-            return 'stepsparring'
-        elif '/Theory/' in path_str:
-            return 'theory'
-        elif '/VocabularyBuilder/' in path_str:
-            return 'vocabulary'
-        else:
-            return 'unknown'
+        for part in file_path.parts:
+            file_type = _TYPE_BY_SEGMENT.get(part)
+            if file_type:
+                return file_type
+        return 'unknown'
 
     def process_file(self, file_path: Path) -> Tuple[bool, str]:
         """
@@ -209,41 +268,30 @@ class LanguagePropertyStandardizer:
             (success: bool, message: str)
         """
         try:
-            # Read original file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read original file, keeping the raw bytes to detect no-op rewrites
+            original = file_path.read_bytes()
+            data = loads(original)
 
             # Detect file type and apply appropriate transformation
             file_type = self.detect_file_type(file_path)
 
-            # Store initial rename count to track changes per file
-            initial_renames = self.stats['properties_renamed']
-
-            if file_type == 'terminology':
-                data = self.standardize_terminology(data)
-            elif file_type == 'techniques':
-                data = self.standardize_techniques(data)
-            elif file_type == 'linework':
-                data = self.standardize_linework(data)
-            elif file_type == 'patterns':
-                data = self.standardize_patterns(data)
-            elif file_type == 'stepsparring':
-                data = self.standardize_stepsparring(data)
-            elif file_type == 'theory':
-                data = self.standardize_theory(data)
-            elif file_type == 'vocabulary':
-                data = self.standardize_vocabulary(data)
-            else:
+            standardize = self._dispatch.get(file_type)
+            if standardize is None:
                 return False, f"Unknown file type: {file_type}"
 
-            changes_count = self.stats['properties_renamed'] - initial_renames
+            # Renames happen in-place; tally this file's counts once
+            changes_count, removed_count = standardize(data)
+            self.stats['properties_renamed'] += changes_count
+            self.stats['empty_fields_removed'] += removed_count
 
             # Write file if not dry-run
             if not self.dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    f.write('\n')  # Add trailing newline
-                self.stats['files_written'] += 1
+                payload = dump_indent2(data, trailing_newline=True)
+                if payload != original:
+                    atomic_write_bytes(file_path, payload)
+                    self.stats['files_written'] += 1
+                else:
+                    self.stats['files_unchanged'] += 1
             else:
                 self.stats['files_analyzed'] += 1
 
@@ -267,14 +315,41 @@ class LanguagePropertyStandardizer:
         print(f"Files found: {len(json_files)}")
         print(f"{'='*70}\n")
 
+        # Skip files untouched since the last live run, process the rest in
+        # parallel and merge each worker's stats back here in sorted order
+        cache = StatCache(CACHE_PATH, __file__)
+        json_files = sorted(json_files)
+        pending = [file_path for file_path in json_files if not cache.is_unchanged(file_path)]
+        jobs = [(self.content_dir, file_path, self.dry_run, self.verbose) for file_path in pending]
+        with ProcessPoolExecutor() as executor:
+            outcomes = dict(zip(pending, executor.map(_process_one, jobs, chunksize=4)))
+
         results = []
-        for file_path in sorted(json_files):
+        report = []
+        for file_path in json_files:
             rel_path = file_path.relative_to(self.content_dir)
-            success, message = self.process_file(file_path)
+            if file_path not in outcomes:
+                self.stats['files_skipped'] += 1
+                report.append(f"✓ {rel_path}: unchanged since last run\n")
+                continue
+
+            success, message, file_stats, file_log = outcomes[file_path]
+            # Dry runs rewrite nothing, so only live successes are remembered
+            if success and not self.dry_run:
+                cache.record(file_path)
+            for key, count in file_stats.items():
+                self.stats[key] += count
+            self.changes_log.extend(file_log)
             results.append((rel_path, success, message))
 
             status_icon = "✓" if success else "✗"
-            print(f"{status_icon} {rel_path}: {message}")
+            report.append(f"{status_icon} {rel_path}: {message}\n")
+
+        # Per-file status lines go out in one write
+        sys.stdout.write(''.join(report))
+
+        if not self.dry_run:
+            cache.save()
 
         # Print summary
         print(f"\n{'='*70}")
@@ -283,12 +358,14 @@ class LanguagePropertyStandardizer:
         print(f"Total files processed: {len(json_files)}")
         print(f"Successful: {sum(1 for _, success, _ in results if success)}")
         print(f"Failed: {sum(1 for _, success, _ in results if not success)}")
+        print(f"Skipped (unchanged since last run): {self.stats['files_skipped']}")
         print(f"Properties renamed: {self.stats['properties_renamed']}")
         print(f"Empty fields removed: {self.stats['empty_fields_removed']}")
         if self.dry_run:
             print(f"Files analyzed (dry-run): {self.stats['files_analyzed']}")
         else:
             print(f"Files written: {self.stats['files_written']}")
+            print(f"Files already up to date: {self.stats['files_unchanged']}")
         print(f"{'='*70}\n")
 
         # Show failures
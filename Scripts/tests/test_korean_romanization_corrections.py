@@ -0,0 +1,58 @@
+"""Tests for korean_romanization_corrections.py"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import korean_romanization_corrections as krc
+
+
+class StatCacheRetryTests(unittest.TestCase):
+    """Only successfully processed files may be recorded in the stat cache"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.pattern_file = self.tmp / '9th_keup_patterns.json'
+        pattern = {'name': 'Chon-Ji', 'moves': [
+            {'move_number': 1, 'technique': 'Front Kick', 'korean_technique': 'Ap Chaki'},
+        ]}
+        self.pattern_file.write_text(json.dumps({'patterns': [pattern]}), encoding='utf-8')
+
+        # Run workers in threads so patches apply, and keep the cache in tmp
+        for target, value in (('ProcessPoolExecutor', ThreadPoolExecutor),
+                              ('CACHE_PATH', self.tmp / '.korean-romanization-cache.json')):
+            patcher = mock.patch.object(krc, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_corrector(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            krc.KoreanRomanizationCorrector().process_all_patterns(str(self.tmp))
+
+    def korean_technique(self):
+        data = json.loads(self.pattern_file.read_text(encoding='utf-8'))
+        return data['patterns'][0]['moves'][0]['korean_technique']
+
+    def test_failed_file_is_reprocessed_on_next_run(self):
+        with mock.patch.object(krc, 'atomic_write_bytes', side_effect=OSError('disk full')):
+            self.run_corrector()
+        self.assertEqual(self.korean_technique(), 'Ap Chaki')
+
+        self.run_corrector()
+        self.assertEqual(self.korean_technique(), 'Ap Chagi')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for update_patterns_from_csv.py"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from update_patterns_from_csv import PatternUpdater
+
+
+class DuplicateSpellingTests(unittest.TestCase):
+    """Two CSV spellings ("Do San" / "Do-San") of one JSON pattern"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.patterns_file = self.tmp / '7th_keup_patterns.json'
+        moves = [
+            {'move_number': n, 'direction': 'A', 'movement': '-', 'stance': 'Walking Stance',
+             'technique': 'Low Block', 'target': 'Low Section'}
+            for n in (1, 2)
+        ]
+        self.patterns_file.write_text(json.dumps({'patterns': [{'name': 'Do-San', 'moves': moves}]}),
+                                      encoding='utf-8')
+        self.csv_file = self.tmp / 'pattern_adjustments.csv'
+        self.csv_file.write_text(
+            'Pattern,Move,Direction,Movement,Stance,Technique,Target\n'
+            'Do San,1,B,-,L Stance,Outer Forearm Block,High Section\n'
+            'Do-San,2,C,-,Walking Stance,Reverse Punch,Middle Section\n',
+            encoding='utf-8'
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_both_spellings_are_applied(self):
+        updater = PatternUpdater(str(self.csv_file), str(self.tmp))
+        updater.load_corrections()
+        with contextlib.redirect_stdout(io.StringIO()):
+            updater.apply_corrections()
+
+        self.assertEqual(updater.patterns_updated, {'Do San', 'Do-San'})
+        self.assertEqual(updater.updates_applied, 2)
+
+        moves = json.loads(self.patterns_file.read_text(encoding='utf-8'))['patterns'][0]['moves']
+        self.assertEqual((moves[0]['direction'], moves[0]['technique']), ('B', 'Outer Forearm Block'))
+        self.assertEqual((moves[1]['direction'], moves[1]['technique']), ('C', 'Reverse Punch'))
+
+
+class PatternFileLookupTests(unittest.TestCase):
+    """Resolving the file for a pattern that appears in more than one file"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        for filename in ('6th_keup_patterns.json', '7th_keup_patterns.json'):
+            (self.tmp / filename).write_text(json.dumps({'patterns': [{'name': 'Do-San', 'moves': []}]}),
+                                             encoding='utf-8')
+        (self.tmp / 'broken.json').write_text('{', encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_mapped_file_wins_over_sort_order(self):
+        updater = PatternUpdater(str(self.tmp / 'unused.csv'), str(self.tmp))
+        self.assertEqual(Path(updater.find_pattern_file('Do San')).name, '7th_keup_patterns.json')
+
+
+if __name__ == '__main__':
+    unittest.main()
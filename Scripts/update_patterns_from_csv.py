@@ -10,39 +10,63 @@ This script:
 """
 
 import csv
-import json
 import os
+import re
 import sys
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from content_io import atomic_write_bytes, dump_indent2, load_json_mapped
+
+# Move fields a CSV correction sets, in the order they are applied
+_FIELDS = ('direction', 'movement', 'stance', 'technique', 'target')
+
+# Degree amounts that mark a movement value as a turn needing a "°" suffix
+_DEG_RE = re.compile(r'45|90|135|180|270|360')
+
+# Sentinel distinguishing a missing move field from one set to ''
+_MISSING = object()
+
+# Pattern name -> files searched first for it, in order; other files are
+# only a fallback
+_PATTERN_FILE_MAP = {
+    'Dan-Gun': ('9th_keup_patterns.json', '8th_keup_patterns.json'),
+    'Do-San': ('7th_keup_patterns.json', '6th_keup_patterns.json'),
+    'Won-Hyo': ('5th_keup_patterns.json', '4th_keup_patterns.json'),
+    'Yul-Gok': ('3rd_keup_patterns.json', '2nd_keup_patterns.json'),
+    'Joong-Gun': ('1st_keup_patterns.json',),
+    'Toi-Gye': ('1st_dan_patterns.json',),
+    'Hwa-Rang': ('1st_dan_patterns.json', '2nd_dan_patterns.json'),
+    'Choong-Moo': ('1st_dan_patterns.json', '2nd_dan_patterns.json'),
+}
 
 class PatternUpdater:
     def __init__(self, csv_file: str, patterns_dir: str):
         self.csv_file = csv_file
         self.patterns_dir = patterns_dir
-        self.corrections = {}
+        # CSV pattern name -> move number -> correction fields
+        self.corrections: Dict[str, Dict[int, Dict[str, str]]] = {}
         self.updates_applied = 0
         self.patterns_updated = set()
+        # Pattern JSON files, listed once; parsed lazily on the first lookup
+        self._dir_files = sorted(Path(patterns_dir).glob('*.json'))
+        self._index: Optional[Dict[str, Tuple[str, Dict[str, Any]]]] = None
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._index_lock = threading.Lock()
         
     def load_corrections(self) -> None:
         """Load corrections from CSV file"""
         print(f"📊 Loading corrections from {self.csv_file}")
         
-        with open(self.csv_file, 'r', encoding='utf-8') as file:
-            # Handle BOM if present
-            content = file.read()
-            if content.startswith('\ufeff'):
-                content = content[1:]
-            
-            reader = csv.DictReader(content.splitlines())
-            
-            for row in reader:
+        # utf-8-sig drops a leading BOM if present
+        with open(self.csv_file, 'r', encoding='utf-8-sig', newline='') as file:
+            for row in csv.DictReader(file):
                 pattern_name = row['Pattern'].strip()
                 move_number = int(row['Move'])
                 
-                # Create correction key
-                key = f"{pattern_name}_{move_number}"
-                
-                self.corrections[key] = {
+                self.corrections.setdefault(pattern_name, {})[move_number] = {
                     'direction': row['Direction'].strip(),
                     'movement': row['Movement'].strip(),
                     'stance': row['Stance'].strip(),
@@ -50,177 +74,216 @@ class PatternUpdater:
                     'target': row['Target'].strip()
                 }
         
-        print(f"✅ Loaded {len(self.corrections)} corrections for {len(set(c.split('_')[0] for c in self.corrections))} patterns")
+        print(f"✅ Loaded {self.correction_count()} corrections for {len(self.corrections)} patterns")
+    
+    def correction_count(self) -> int:
+        """Total number of move corrections loaded"""
+        return sum(map(len, self.corrections.values()))
     
     def standardize_values(self, correction: Dict[str, str]) -> Dict[str, str]:
         """Standardize values to match expected JSON format"""
-        standardized = correction.copy()
-        
-        # Standardize movement values
-        movement = standardized['movement']
-        if movement == '-':
-            standardized['movement'] = '-'
-        elif movement.isdigit():
+        # Standardize movement values ("-" is kept as is)
+        movement = correction['movement']
+        if movement.isdigit():
             # Handle cases like "90" -> "Left 90°" or "Right 90°" 
             # We need context to determine left/right, so preserve as is for now
             if movement == '90':
-                standardized['movement'] = f"Left {movement}°"  # Default assumption
+                movement = f"Left {movement}°"  # Default assumption
             else:
-                standardized['movement'] = f"{movement}°" if not movement.endswith('°') else movement
-        elif not movement.endswith('°') and any(deg in movement for deg in ['90', '180', '270', '360', '45', '135']):
-            if '°' not in movement:
-                standardized['movement'] = movement + '°'
+                movement = f"{movement}°"
+        elif '°' not in movement and _DEG_RE.search(movement):
+            movement += '°'
         
         # Standardize stance values
-        stance = standardized['stance']
+        stance = correction['stance']
         if 'L Stance' in stance and '-' not in stance:
-            standardized['stance'] = stance.replace('L Stance', 'L-stance')
-        elif stance == 'Walking Stance':
-            standardized['stance'] = stance  # Keep as is
-        
-        # Ensure proper capitalization for techniques
-        standardized['technique'] = standardized['technique'].strip()
+            stance = stance.replace('L Stance', 'L-stance')
         
-        return standardized
+        return {
+            'direction': correction['direction'],
+            'movement': movement,
+            'stance': stance,
+            # Ensure proper capitalization for techniques
+            'technique': correction['technique'].strip(),
+            'target': correction['target']
+        }
     
     def normalize_pattern_name(self, name: str) -> str:
         """Convert CSV pattern name to JSON pattern name format"""
         # CSV uses "Do San" format, JSON uses "Do-San" format
         return name.replace(' ', '-')
     
+    def _build_index(self) -> None:
+        """
+        Parse every pattern file once and index its patterns by JSON name.
+        
+        A name found in several files resolves to the first of its
+        _PATTERN_FILE_MAP files that holds it, else the first file (sorted).
+        """
+        found: Dict[str, List[str]] = {}
+        for path in self._dir_files:
+            file_path = str(path)
+            try:
+                data = load_json_mapped(file_path)
+            except (OSError, ValueError):
+                continue
+            self._documents[file_path] = data
+            for pattern in data.get('patterns', []):
+                files = found.setdefault(pattern['name'], [])
+                if file_path not in files:
+                    files.append(file_path)
+        
+        index = {}
+        for name, files in found.items():
+            by_filename = {os.path.basename(file_path): file_path for file_path in files}
+            preferred = (by_filename[f] for f in _PATTERN_FILE_MAP.get(name, ()) if f in by_filename)
+            file_path = next(preferred, files[0])
+            index[name] = (file_path, self._documents[file_path])
+        self._index = index
+    
+    def _ensure_index(self) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Build the pattern index on first use (safe to call from worker threads)"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._build_index()
+        return self._index
+    
     def find_pattern_file(self, pattern_name: str) -> str:
         """Find the JSON file containing the specified pattern"""
         # Convert CSV name format to JSON name format
         json_pattern_name = self.normalize_pattern_name(pattern_name)
         
-        # Map pattern names to approximate belt levels for file searching
-        pattern_file_map = {
-            'Dan-Gun': ['9th_keup_patterns.json', '8th_keup_patterns.json'],
-            'Do-San': ['7th_keup_patterns.json', '6th_keup_patterns.json'], 
-            'Won-Hyo': ['5th_keup_patterns.json', '4th_keup_patterns.json'],
-            'Yul-Gok': ['3rd_keup_patterns.json', '2nd_keup_patterns.json'],
-            'Joong-Gun': ['1st_keup_patterns.json'],
-            'Toi-Gye': ['1st_dan_patterns.json'],
-            'Hwa-Rang': ['1st_dan_patterns.json', '2nd_dan_patterns.json'],
-            'Choong-Moo': ['1st_dan_patterns.json', '2nd_dan_patterns.json']
-        }
+        index = self._ensure_index()
+        if json_pattern_name in index:
+            return index[json_pattern_name][0]
         
-        # Try specific files first
-        if json_pattern_name in pattern_file_map:
-            for filename in pattern_file_map[json_pattern_name]:
-                file_path = os.path.join(self.patterns_dir, filename)
-                if os.path.exists(file_path):
-                    # Check if pattern actually exists in this file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            for pattern in data.get('patterns', []):
-                                if pattern['name'] == json_pattern_name:
-                                    return file_path
-                    except:
-                        continue
+        raise FileNotFoundError(f"Pattern '{pattern_name}' not found in any JSON file")
+    
+    def update_pattern_file(self, file_path: str,
+                            file_corrections: Dict[str, Dict[int, Dict[str, str]]]) -> Dict[str, Tuple[Optional[int], List[str]]]:
+        """
+        Apply every correction for patterns stored in one file, writing it at most once
         
-        # Fallback: search all files
-        for filename in os.listdir(self.patterns_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(self.patterns_dir, filename)
+        Args:
+            file_path: Pattern JSON file
+            file_corrections: CSV pattern name -> move number -> correction fields
+            
+        Returns:
+            CSV pattern name -> (updates applied, or None on failure; log lines)
+        """
+        # Already parsed by _build_index; mutate it in place
+        data = self._documents[file_path]
+        filename = os.path.basename(file_path)
+        results = {}
+        dirty = False
+        
+        # Single pass over the file's patterns, correcting each one listed.
+        # Several CSV spellings (e.g. "Do San" and "Do-San") can name the same
+        # pattern; they are applied in CSV order, later rows winning
+        csv_names: Dict[str, List[str]] = {}
+        for name in file_corrections:
+            csv_names.setdefault(self.normalize_pattern_name(name), []).append(name)
+        for pattern in data.get('patterns', []):
+            for pattern_name in csv_names.pop(pattern['name'], ()):
+                report = [f"📝 Updating {filename} for pattern '{pattern['name']}'"]
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for pattern in data.get('patterns', []):
-                            if pattern['name'] == json_pattern_name:
-                                return file_path
-                except:
-                    continue
+                    updates, changed = self._update_pattern(pattern, file_corrections[pattern_name], report)
+                    dirty |= changed
+                    results[pattern_name] = (updates, report)
+                except Exception as e:
+                    report.append(f"   ❌ Error updating {pattern_name}: {e}")
+                    results[pattern_name] = (None, report)
         
-        raise FileNotFoundError(f"Pattern '{pattern_name}' not found in any JSON file")
-    
-    def update_pattern_file(self, file_path: str, pattern_name: str, corrections: Dict[str, Dict[str, str]]) -> int:
-        """Update a specific pattern file with corrections"""
-        json_pattern_name = self.normalize_pattern_name(pattern_name)
-        print(f"📝 Updating {os.path.basename(file_path)} for pattern '{json_pattern_name}'")
+        # Names with no pattern in this file: nothing to apply
+        for json_name, names in csv_names.items():
+            for pattern_name in names:
+                results[pattern_name] = (0, [f"📝 Updating {filename} for pattern '{json_name}'"])
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Write updated file, unless every correction was already in place
+        if dirty:
+            try:
+                atomic_write_bytes(file_path, dump_indent2(data))
+            except Exception as e:
+                for pattern_name, (_, report) in results.items():
+                    report.append(f"   ❌ Error updating {pattern_name}: {e}")
+                    results[pattern_name] = (None, report)
+        
+        for pattern_name, (updates, report) in results.items():
+            if updates is not None:
+                report.append(f"   ✅ Applied {updates} corrections to {pattern_name}")
         
+        return results
+    
+    def _update_pattern(self, pattern: Dict[str, Any], corrections: Dict[int, Dict[str, str]],
+                        report: List[str]) -> Tuple[int, bool]:
+        """Apply corrections to one pattern's moves; returns (updates applied, whether anything changed)"""
         updates_count = 0
+        dirty = False
         
-        # Find the pattern and update moves
-        for pattern in data.get('patterns', []):
-            if pattern['name'] == json_pattern_name:
-                for move in pattern.get('moves', []):
-                    move_number = move['move_number']
-                    correction_key = f"{pattern_name}_{move_number}"
-                    
-                    if correction_key in corrections:
-                        correction = self.standardize_values(corrections[correction_key])
-                        
-                        # Apply corrections
-                        old_values = {
-                            'direction': move.get('direction', ''),
-                            'movement': move.get('movement', ''),
-                            'stance': move.get('stance', ''),
-                            'technique': move.get('technique', ''),
-                            'target': move.get('target', '')
-                        }
-                        
-                        move['direction'] = correction['direction']
-                        move['movement'] = correction['movement']
-                        move['stance'] = correction['stance']
-                        move['technique'] = correction['technique']
-                        move['target'] = correction['target']
-                        
-                        print(f"   Move {move_number}:")
-                        for field in ['direction', 'movement', 'stance', 'technique', 'target']:
-                            if old_values[field] != correction[field]:
-                                print(f"     {field}: '{old_values[field]}' → '{correction[field]}'")
-                        
-                        updates_count += 1
+        for move in pattern.get('moves', []):
+            move_number = move['move_number']
+            
+            if move_number in corrections:
+                correction = self.standardize_values(corrections[move_number])
                 
-                break
-        
-        # Write updated file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+                # Apply corrections, touching only fields that differ
+                # (or are missing) and logging visible changes
+                report.append(f"   Move {move_number}:")
+                for field in _FIELDS:
+                    old_value = move.get(field, _MISSING)
+                    new_value = correction[field]
+                    if old_value != new_value:
+                        move[field] = new_value
+                        dirty = True
+                        if old_value is _MISSING:
+                            old_value = ''
+                        if old_value != new_value:
+                            report.append(f"     {field}: '{old_value}' → '{new_value}'")
+                
+                updates_count += 1
         
-        return updates_count
+        return updates_count, dirty
     
     def apply_corrections(self) -> None:
         """Apply all corrections to JSON files"""
         print(f"\n🔧 Applying corrections to pattern files...")
         
-        # Group corrections by pattern
-        patterns_to_correct = {}
-        for key, correction in self.corrections.items():
-            pattern_name = key.split('_')[0]
-            if pattern_name not in patterns_to_correct:
-                patterns_to_correct[pattern_name] = {}
-            patterns_to_correct[pattern_name][key] = correction
-        
-        # Process each pattern
-        for pattern_name, pattern_corrections in patterns_to_correct.items():
+        # Group corrections by file, so a file holding several patterns is
+        # corrected in one pass and written once
+        file_groups: Dict[str, Dict[str, Dict[int, Dict[str, str]]]] = {}
+        results: Dict[str, Tuple[Optional[int], List[str]]] = {}
+        for pattern_name, pattern_corrections in self.corrections.items():
             try:
                 file_path = self.find_pattern_file(pattern_name)
-                updates = self.update_pattern_file(file_path, pattern_name, pattern_corrections)
+            except FileNotFoundError as e:
+                results[pattern_name] = (None, [f"   ❌ {e}"])
+                continue
+            file_groups.setdefault(file_path, {})[pattern_name] = pattern_corrections
+        
+        # Files are independent, so process them in parallel (orjson
+        # serialize releases the GIL); logs are printed here in CSV order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for file_results in executor.map(self.update_pattern_file, file_groups.keys(), file_groups.values()):
+                results.update(file_results)
+        
+        for pattern_name in self.corrections:
+            updates, report = results.get(pattern_name, (None, [f"   ❌ Error updating {pattern_name}: no result"]))
+            print('\n'.join(report))
+            if updates is not None:
                 self.updates_applied += updates
                 self.patterns_updated.add(pattern_name)
-                print(f"   ✅ Applied {updates} corrections to {pattern_name}")
-                
-            except FileNotFoundError as e:
-                print(f"   ❌ {e}")
-            except Exception as e:
-                print(f"   ❌ Error updating {pattern_name}: {e}")
     
     def generate_report(self) -> None:
         """Generate summary report"""
         print(f"\n📊 UPDATE SUMMARY:")
-        print(f"   Corrections loaded: {len(self.corrections)}")
+        print(f"   Corrections loaded: {self.correction_count()}")
         print(f"   Updates applied: {self.updates_applied}")
         print(f"   Patterns updated: {len(self.patterns_updated)}")
         print(f"   Updated patterns: {', '.join(sorted(self.patterns_updated))}")
         
-        if self.updates_applied != len(self.corrections):
-            print(f"   ⚠️  {len(self.corrections) - self.updates_applied} corrections were not applied")
+        if self.updates_applied != self.correction_count():
+            print(f"   ⚠️  {self.correction_count() - self.updates_applied} corrections were not applied")
 
 def main():
     # Set up paths
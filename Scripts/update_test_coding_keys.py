@@ -6,9 +6,136 @@ This script updates test files that load JSON directly to use the new
 standardized property names (english, romanised, hangul, phonetic).
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
+
+from content_io import StatCache
+
+# Sidecar recording which test files were already clean after a live run
+CACHE_PATH = Path(__file__).parent / '.coding-keys-cache.json'
+
+# CodingKeys enum case rules applied to every file:
+# (group name, case identifier pattern, old JSON key, new JSON key)
+_CASE_RULES = (
+    # StepSparring: koreanName = "korean_name" → koreanName = "romanised"
+    ('korean_name', r'\w*[Kk]orean[Nn]ame', 'korean_name', 'romanised'),
+    # Terminology: romanizedPronunciation = "romanized_pronunciation" → "romanised"
+    ('romanized_pronunciation', r'\w*[Rr]omanized\w*', 'romanized_pronunciation', 'romanised'),
+    # Terminology: englishTerm = "english_term" → englishTerm = "english"
+    ('english_term', r'\w*[Ee]nglish[Tt]erm', 'english_term', 'english'),
+    # Terminology: koreanHangul = "korean_hangul" → koreanHangul = "hangul"
+    ('korean_hangul', r'\w*[Kk]orean[Hh]angul', 'korean_hangul', 'hangul'),
+    # Terminology: phoneticPronunciation = "phonetic_pronunciation" → "phonetic"
+    ('phonetic_pronunciation', r'\w*[Pp]honetic[Pp]ronunciation', 'phonetic_pronunciation', 'phonetic'),
+)
+
+# CodingKeys case rules for Pattern contexts only (not Theory, which uses
+# different semantics for "pronunciation")
+_PATTERN_CASE_RULES = (
+    # pronunciation = "pronunciation" → pronunciation = "romanised"
+    ('pronunciation', r'pronunciation', 'pronunciation', 'romanised'),
+    # Pattern moves: technique = "technique" → technique = "english"
+    ('technique', r'technique', 'technique', 'english'),
+    # Pattern moves: koreanTechnique = "korean_technique" → "romanised"
+    ('korean_technique', r'\w*[Kk]orean[Tt]echnique', 'korean_technique', 'romanised'),
+)
+
+# Context-free rules: (group name, pattern, replacement)
+# Property access - .romanized → .romanised
+_PROPERTY_RULE = ('dot_romanized', r'\.romanized\b', '.romanised')
+
+# VocabularyWord/similar structs: "romanized" in Codable property lists.
+# A plain literal, so it is applied with str.replace rather than the regex
+_VOCABULARY_LITERAL = ('"romanized"', '"romanised"')
+
+
+def _fuse_rules(case_rules, literal_rules):
+    """
+    Compile rules into one alternation so a file is scanned once.
+
+    Returns (regex, replacements) where replacements maps each named group to
+    a function building that match's replacement text.
+    """
+    alternatives = []
+    replacements = {}
+    for name, identifier, old_key, new_key in case_rules:
+        alternatives.append(rf'case\s+(?P<{name}>{identifier})\s*=\s*"{old_key}"')
+        replacements[name] = lambda match, name=name, new_key=new_key: f'case {match[name]} = "{new_key}"'
+    for name, pattern, replacement in literal_rules:
+        alternatives.append(rf'(?P<{name}>{pattern})')
+        replacements[name] = lambda match, replacement=replacement: replacement
+    return re.compile('|'.join(alternatives)), replacements
+
+
+# pattern context -> fused rules for that kind of file
+_FUSED_RULES = {
+    pattern_context: _fuse_rules(
+        _CASE_RULES + (_PATTERN_CASE_RULES if pattern_context else ()),
+        (_PROPERTY_RULE,),
+    )
+    for pattern_context in (False, True)
+}
+
+# Literal text every rule needs to match; files containing none are skipped
+# before any regex work
+_NEEDLES = tuple(
+    f'"{old_key}"' for _, _, old_key, _ in _CASE_RULES + _PATTERN_CASE_RULES
+) + ('.romanized', _VOCABULARY_LITERAL[0])
+_BYTE_NEEDLES = tuple(needle.encode('utf-8') for needle in _NEEDLES)
+
+
+def iter_swift_files(root: Path) -> Iterator[Path]:
+    """Recursively yield *.swift files under root, using scandir's cached dirents."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.swift') and entry.is_file():
+                    yield Path(entry.path)
+
+
+def rewrite_file(file_path: Path) -> Tuple[Optional[str], int]:
+    """
+    Apply the CodingKeys rewrites to one Swift file without writing it.
+
+    Returns:
+        (modified content, or None if unchanged, replacement_count)
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+
+    # Most test files reference none of the legacy keys: check the raw bytes
+    # so those are never decoded
+    if not any(needle in raw for needle in _BYTE_NEEDLES):
+        return None, 0
+
+    # Decode with the same universal-newline handling as a text-mode read
+    original_content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    # Pattern rules only apply if file contains "Pattern" in name or has
+    # PatternJSON structs
+    pattern_context = 'Pattern' in file_path.name or 'PatternJSON' in original_content
+    regex, replacements = _FUSED_RULES[pattern_context]
+    modified_content, replacement_count = regex.subn(
+        lambda match: replacements[match.lastgroup](match), original_content
+    )
+
+    # "romanized" literals only in Vocabulary files
+    if 'Vocabulary' in file_path.name:
+        old, new = _VOCABULARY_LITERAL
+        literal_count = modified_content.count(old)
+        if literal_count:
+            modified_content = modified_content.replace(old, new)
+            replacement_count += literal_count
+
+    if modified_content == original_content:
+        return None, replacement_count
+    return modified_content, replacement_count
 
 
 class TestCodingKeysUpdater:
@@ -20,6 +147,7 @@ class TestCodingKeysUpdater:
         self.stats = {
             'files_processed': 0,
             'files_modified': 0,
+            'files_skipped': 0,
             'replacements_made': 0
         }
 
@@ -30,87 +158,12 @@ class TestCodingKeysUpdater:
         Returns:
             (was_modified: bool, replacement_count: int)
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-
-        modified_content = original_content
-        replacement_count = 0
-
-        # Pattern 1: CodingKeys enum cases - StepSparring
-        # korean_name = "korean_name" → korean_name = "romanised"
-        pattern1 = r'case\s+(\w*[Kk]orean[Nn]ame)\s*=\s*"korean_name"'
-        replacement1 = r'case \1 = "romanised"'
-        modified_content, count1 = re.subn(pattern1, replacement1, modified_content)
-        replacement_count += count1
-
-        # Pattern 2: CodingKeys enum cases - Terminology
-        # romanizedPronunciation = "romanized_pronunciation" → romanizedPronunciation = "romanised"
-        pattern2 = r'case\s+(\w*[Rr]omanized\w*)\s*=\s*"romanized_pronunciation"'
-        replacement2 = r'case \1 = "romanised"'
-        modified_content, count2 = re.subn(pattern2, replacement2, modified_content)
-        replacement_count += count2
-
-        # Pattern 3: CodingKeys enum cases - Terminology
-        # englishTerm = "english_term" → englishTerm = "english"
-        pattern3 = r'case\s+(\w*[Ee]nglish[Tt]erm)\s*=\s*"english_term"'
-        replacement3 = r'case \1 = "english"'
-        modified_content, count3 = re.subn(pattern3, replacement3, modified_content)
-        replacement_count += count3
-
-        # Pattern 4: CodingKeys enum cases - Terminology
-        # koreanHangul = "korean_hangul" → koreanHangul = "hangul"
-        pattern4 = r'case\s+(\w*[Kk]orean[Hh]angul)\s*=\s*"korean_hangul"'
-        replacement4 = r'case \1 = "hangul"'
-        modified_content, count4 = re.subn(pattern4, replacement4, modified_content)
-        replacement_count += count4
-
-        # Pattern 5: CodingKeys enum cases - Terminology
-        # phoneticPronunciation = "phonetic_pronunciation" → phoneticPronunciation = "phonetic"
-        pattern5 = r'case\s+(\w*[Pp]honetic[Pp]ronunciation)\s*=\s*"phonetic_pronunciation"'
-        replacement5 = r'case \1 = "phonetic"'
-        modified_content, count5 = re.subn(pattern5, replacement5, modified_content)
-        replacement_count += count5
-
-        # Pattern 6: CodingKeys enum cases - Pattern
-        # pronunciation = "pronunciation" → pronunciation = "romanised"
-        # (only when in Pattern context, not Theory which uses different semantics)
-        pattern6 = r'case\s+(pronunciation)\s*=\s*"pronunciation"'
-        replacement6 = r'case \1 = "romanised"'
-        # Only apply if file contains "Pattern" in name or has PatternJSON structs
-        if 'Pattern' in file_path.name or 'PatternJSON' in original_content:
-            modified_content, count6 = re.subn(pattern6, replacement6, modified_content)
-            replacement_count += count6
-
-        # Pattern 7: CodingKeys enum cases - Pattern moves
-        # technique = "technique" → technique = "english"
-        # koreanTechnique = "korean_technique" → koreanTechnique = "romanised"
-        # (only in Pattern move contexts)
-        if 'Pattern' in file_path.name or 'PatternJSON' in original_content:
-            pattern7a = r'case\s+(technique)\s*=\s*"technique"'
-            replacement7a = r'case \1 = "english"'
-            modified_content, count7a = re.subn(pattern7a, replacement7a, modified_content)
-            replacement_count += count7a
-
-            pattern7b = r'case\s+(\w*[Kk]orean[Tt]echnique)\s*=\s*"korean_technique"'
-            replacement7b = r'case \1 = "romanised"'
-            modified_content, count7b = re.subn(pattern7b, replacement7b, modified_content)
-            replacement_count += count7b
-
-        # Pattern 8: Property access - .romanized → .romanised
-        pattern8 = r'\.romanized\b'
-        replacement8 = r'.romanised'
-        modified_content, count8 = re.subn(pattern8, replacement8, modified_content)
-        replacement_count += count8
-
-        # Pattern 9: VocabularyWord/similar structs
-        # "romanized" in Codable property lists
-        pattern9 = r'"romanized"'
-        replacement9 = r'"romanised"'
-        if 'Vocabulary' in file_path.name:
-            modified_content, count9 = re.subn(pattern9, replacement9, modified_content)
-            replacement_count += count9
-
-        was_modified = (modified_content != original_content)
+        modified_content, replacement_count = rewrite_file(file_path)
+        return self._record(file_path, modified_content, replacement_count)
+
+    def _record(self, file_path: Path, modified_content: Optional[str], replacement_count: int) -> Tuple[bool, int]:
+        """Write back a rewritten file (unless dry-run) and update stats."""
+        was_modified = modified_content is not None
 
         if was_modified and not self.dry_run:
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -122,7 +175,7 @@ class TestCodingKeysUpdater:
 
     def process_all(self) -> None:
         """Process all Swift test files in the tests directory."""
-        test_files = list(self.tests_dir.glob('**/*.swift'))
+        test_files = list(iter_swift_files(self.tests_dir))
 
         print(f"\n{'='*70}")
         print(f"Test CodingKeys Updater")
@@ -131,10 +184,23 @@ class TestCodingKeysUpdater:
         print(f"Test files found: {len(test_files)}")
         print(f"{'='*70}\n")
 
+        # Skip files left clean by the last live run, rewrite the rest in
+        # parallel; only this process writes to disk
+        cache = StatCache(CACHE_PATH, __file__)
+        test_files = sorted(test_files)
+        pending = [file_path for file_path in test_files if not cache.is_unchanged(file_path)]
+        self.stats['files_skipped'] = len(test_files) - len(pending)
+        self.stats['files_processed'] += self.stats['files_skipped']
+        with ProcessPoolExecutor() as executor:
+            rewrites = list(executor.map(rewrite_file, pending, chunksize=8))
+
         results = []
-        for file_path in sorted(test_files):
-            was_modified, replacement_count = self.update_file(file_path)
+        for file_path, (modified_content, replacement_count) in zip(pending, rewrites):
+            was_modified, replacement_count = self._record(file_path, modified_content, replacement_count)
             self.stats['files_processed'] += 1
+            # A written file is clean too; dry runs leave it dirty, so skip recording
+            if not self.dry_run:
+                cache.record(file_path)
 
             if was_modified or replacement_count > 0:
                 rel_path = file_path.relative_to(self.tests_dir)
@@ -142,12 +208,16 @@ class TestCodingKeysUpdater:
                 results.append((rel_path, replacement_count))
                 print(f"{status} {rel_path}: {replacement_count} replacements")
 
+        if not self.dry_run:
+            cache.save()
+
         # Print summary
         print(f"\n{'='*70}")
         print(f"Summary")
         print(f"{'='*70}")
         print(f"Files processed: {self.stats['files_processed']}")
         print(f"Files modified: {self.stats['files_modified']}")
+        print(f"Skipped (unchanged since last run): {self.stats['files_skipped']}")
         print(f"Total replacements: {self.stats['replacements_made']}")
         print(f"{'='*70}\n")
 
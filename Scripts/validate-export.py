@@ -6,23 +6,70 @@ Validates JSON structure and data integrity of exported profiles
 """
 
 import json
+import os
+import re
 import sys
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from content_io import load_json_mapped
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Container exports at least this large are validated one profile at a time
+# by streaming (when ijson is installed) rather than parsed whole
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Canonical 8-4-4-4-12 form, as exported by the app
+_UUID_RE = re.compile(r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z')
+_fromisoformat = datetime.fromisoformat
+
+MASTERY_LEVELS = frozenset({'learning', 'familiar', 'proficient', 'mastered'})
+SESSION_TYPES = frozenset({'flashcards', 'testing', 'patterns', 'mixed'})
+
+# Profile schema
+REQUIRED_FIELDS = (
+    'id', 'name', 'avatar', 'colorTheme', 'currentBeltLevel',
+    'learningMode', 'createdAt', 'lastActiveAt', 'totalStudyTime',
+    'dailyStudyGoal', 'streakDays', 'totalFlashcardsSeen',
+    'totalTestsTaken', 'totalPatternsLearned', 'terminologyProgress',
+    'patternProgress', 'studySessions', 'stepSparringProgress',
+    'gradingHistory', 'exportedAt', 'appVersion', 'exportVersion'
+)
+DATE_FIELDS = ('createdAt', 'lastActiveAt', 'exportedAt')
+NUMERIC_FIELDS = ('totalStudyTime', 'dailyStudyGoal', 'streakDays',
+                  'totalFlashcardsSeen', 'totalTestsTaken', 'totalPatternsLearned')
+LIST_FIELDS = ('terminologyProgress', 'patternProgress', 'studySessions',
+               'stepSparringProgress', 'gradingHistory')
+
+_MISSING = object()
 
 def validate_uuid(uuid_str: str) -> bool:
     """Validate UUID format"""
+    if _UUID_RE.match(uuid_str):
+        return True
+    # Fall back to the full parser for the other spellings UUID() accepts
     try:
-        from uuid import UUID
         UUID(uuid_str)
         return True
     except ValueError:
         return False
 
+def is_number(value: Any) -> bool:
+    """JSON number check; booleans are rejected even though bool subclasses int"""
+    value_type = type(value)
+    return value_type is int or value_type is float
+
 def validate_iso_date(date_str: str) -> bool:
     """Validate ISO8601 date format"""
     try:
-        datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        _fromisoformat(date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str)
         return True
     except ValueError:
         return False
@@ -32,16 +79,7 @@ def validate_profile(profile: Dict[str, Any]) -> List[str]:
     errors = []
     
     # Required fields
-    required_fields = [
-        'id', 'name', 'avatar', 'colorTheme', 'currentBeltLevel',
-        'learningMode', 'createdAt', 'lastActiveAt', 'totalStudyTime',
-        'dailyStudyGoal', 'streakDays', 'totalFlashcardsSeen',
-        'totalTestsTaken', 'totalPatternsLearned', 'terminologyProgress',
-        'patternProgress', 'studySessions', 'stepSparringProgress',
-        'gradingHistory', 'exportedAt', 'appVersion', 'exportVersion'
-    ]
-    
-    for field in required_fields:
+    for field in REQUIRED_FIELDS:
         if field not in profile:
             errors.append(f"Missing required field: {field}")
     
@@ -50,24 +88,22 @@ def validate_profile(profile: Dict[str, Any]) -> List[str]:
         errors.append(f"Invalid UUID format for profile id: {profile['id']}")
     
     # Validate dates
-    date_fields = ['createdAt', 'lastActiveAt', 'exportedAt']
-    for field in date_fields:
-        if field in profile and not validate_iso_date(profile[field]):
-            errors.append(f"Invalid date format for {field}: {profile[field]}")
+    for field in DATE_FIELDS:
+        value = profile.get(field, _MISSING)
+        if value is not _MISSING and not validate_iso_date(value):
+            errors.append(f"Invalid date format for {field}: {value}")
     
     # Validate numeric fields
-    numeric_fields = ['totalStudyTime', 'dailyStudyGoal', 'streakDays', 
-                     'totalFlashcardsSeen', 'totalTestsTaken', 'totalPatternsLearned']
-    for field in numeric_fields:
-        if field in profile and not isinstance(profile[field], (int, float)):
-            errors.append(f"Field {field} should be numeric: {profile[field]}")
+    for field in NUMERIC_FIELDS:
+        value = profile.get(field, _MISSING)
+        if value is not _MISSING and not is_number(value):
+            errors.append(f"Field {field} should be numeric: {value}")
     
     # Validate progress arrays
-    progress_fields = ['terminologyProgress', 'patternProgress', 'studySessions', 
-                      'stepSparringProgress', 'gradingHistory']
-    for field in progress_fields:
-        if field in profile and not isinstance(profile[field], list):
-            errors.append(f"Field {field} should be an array: {type(profile[field])}")
+    for field in LIST_FIELDS:
+        value = profile.get(field, _MISSING)
+        if value is not _MISSING and type(value) is not list:
+            errors.append(f"Field {field} should be an array: {type(value)}")
     
     # Validate terminology progress entries
     if 'terminologyProgress' in profile:
@@ -76,7 +112,7 @@ def validate_profile(profile: Dict[str, Any]) -> List[str]:
                 errors.append(f"Invalid UUID in terminologyProgress[{i}].id")
             if not validate_uuid(progress.get('terminologyEntryID', '')):
                 errors.append(f"Invalid UUID in terminologyProgress[{i}].terminologyEntryID")
-            if progress.get('masteryLevel') not in ['learning', 'familiar', 'proficient', 'mastered']:
+            if progress.get('masteryLevel') not in MASTERY_LEVELS:
                 errors.append(f"Invalid masteryLevel in terminologyProgress[{i}]: {progress.get('masteryLevel')}")
     
     # Validate study sessions
@@ -84,21 +120,81 @@ def validate_profile(profile: Dict[str, Any]) -> List[str]:
         for i, session in enumerate(profile['studySessions']):
             if not validate_uuid(session.get('id', '')):
                 errors.append(f"Invalid UUID in studySessions[{i}].id")
-            if session.get('sessionType') not in ['flashcards', 'testing', 'patterns', 'mixed']:
+            if session.get('sessionType') not in SESSION_TYPES:
                 errors.append(f"Invalid sessionType in studySessions[{i}]: {session.get('sessionType')}")
             if 'accuracy' in session and session['accuracy'] is not None:
                 accuracy = session['accuracy']
-                if not isinstance(accuracy, (int, float)) or not (0.0 <= accuracy <= 1.0):
+                if not is_number(accuracy) or not (0.0 <= accuracy <= 1.0):
                     errors.append(f"Invalid accuracy in studySessions[{i}]: {accuracy}")
     
     return errors
 
+def scan_container(filename: str) -> Optional[Tuple[Set[str], int]]:
+    """
+    Stream through a container export once without building it.
+
+    Returns (top-level keys, number of profiles), or None if the file is not a
+    profile container (e.g. a single profile export).
+    """
+    keys = set()
+    profile_count = 0
+    with open(filename, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == '':
+                if event == 'map_key':
+                    keys.add(value)
+                elif event == 'start_array':
+                    return None
+            elif prefix == 'profiles.item' and event not in ('map_key', 'end_map', 'end_array'):
+                profile_count += 1
+    return (keys, profile_count) if 'profiles' in keys else None
+
+def iter_profiles(filename: str) -> Iterator[Dict[str, Any]]:
+    """Yield a container's profiles one at a time from the stream"""
+    with open(filename, 'rb') as f:
+        yield from ijson.items(f, 'profiles.item', use_float=True)
+
+def report_container(container: Iterable[str], profile_count: int, profiles: Iterable[Dict[str, Any]]) -> None:
+    """Validate and report on a profile container's fields and each of its profiles"""
+    print(f"📁 Container file with {profile_count} profile(s)")
+    
+    container_errors = []
+    if 'exportedAt' not in container:
+        container_errors.append("Missing exportedAt in container")
+    if 'deviceName' not in container:
+        container_errors.append("Missing deviceName in container")
+    if 'appVersion' not in container:
+        container_errors.append("Missing appVersion in container")
+    if 'exportVersion' not in container:
+        container_errors.append("Missing exportVersion in container")
+    
+    if container_errors:
+        print("❌ Container validation errors:")
+        for error in container_errors:
+            print(f"   - {error}")
+    else:
+        print("✅ Container structure valid")
+    
+    # Validate each profile
+    for i, profile in enumerate(profiles):
+        print(f"\n👤 Validating profile {i+1}: {profile.get('name', 'Unknown')}")
+        errors = validate_profile(profile)
+        if errors:
+            print(f"❌ Profile {i+1} validation errors:")
+            for error in errors:
+                print(f"   - {error}")
+        else:
+            print(f"✅ Profile {i+1} structure valid")
+
 def validate_export_file(filename: str) -> None:
     """Validate an export file"""
     try:
-        with open(filename, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        # Large containers are streamed; everything else is parsed whole
+        streamed = None
+        if ijson is not None and os.path.getsize(filename) >= STREAM_THRESHOLD:
+            streamed = scan_container(filename)
+        data = load_json_mapped(filename) if streamed is None else None
+    except JSON_ERRORS as e:
         print(f"❌ Invalid JSON format: {e}")
         return
     except FileNotFoundError:
@@ -108,37 +204,14 @@ def validate_export_file(filename: str) -> None:
     print(f"🔍 Validating export file: {filename}")
     
     # Check if it's a single profile or profile container
-    if 'profiles' in data:
+    if streamed is not None:
+        # Multiple profiles container, validated one profile at a time
+        container_keys, profile_count = streamed
+        report_container(container_keys, profile_count, iter_profiles(filename))
+    
+    elif 'profiles' in data:
         # Multiple profiles container
-        print(f"📁 Container file with {len(data['profiles'])} profile(s)")
-        
-        container_errors = []
-        if 'exportedAt' not in data:
-            container_errors.append("Missing exportedAt in container")
-        if 'deviceName' not in data:
-            container_errors.append("Missing deviceName in container")
-        if 'appVersion' not in data:
-            container_errors.append("Missing appVersion in container")
-        if 'exportVersion' not in data:
-            container_errors.append("Missing exportVersion in container")
-        
-        if container_errors:
-            print("❌ Container validation errors:")
-            for error in container_errors:
-                print(f"   - {error}")
-        else:
-            print("✅ Container structure valid")
-        
-        # Validate each profile
-        for i, profile in enumerate(data['profiles']):
-            print(f"\n👤 Validating profile {i+1}: {profile.get('name', 'Unknown')}")
-            errors = validate_profile(profile)
-            if errors:
-                print(f"❌ Profile {i+1} validation errors:")
-                for error in errors:
-                    print(f"   - {error}")
-            else:
-                print(f"✅ Profile {i+1} structure valid")
+        report_container(data, len(data['profiles']), data['profiles'])
     
     else:
         # Single profile
@@ -6,11 +6,164 @@ Transforms CSV data into JSON format matching existing TKDojang structure
 
 import json
 import csv
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback, same output bytes
+    orjson = None
+
+# Characters not allowed in generated ids; spaces included, so this one
+# substitution also does the space -> underscore step
+_ID_RE = re.compile(r'[^a-z0-9_]')
+
+
+# Existing translation of a technique: (romanised, hangul, description)
+Translation = Tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Technique:
+    """One technique within a line work exercise; fields serialize in this order"""
+    id: str
+    english: str
+    romanised: str
+    hangul: str
+    category: str
+    target_area: Optional[str]
+    description: str
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """int(text), or None if text isn't an integer"""
+    text = text.strip()
+    # Plain digit strings (the normal case) always convert
+    if text.isdecimal():
+        return int(text)
+    # Signs, underscores etc. are rare; let int() decide
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _flag_table(items: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Table indexed by bit set: entry n holds the items whose bit is set in n, in order"""
+    return tuple(
+        tuple(item for bit, item in enumerate(items) if flags >> bit & 1)
+        for flags in range(1 << len(items))
+    )
+
+
+def _loads(buf: bytes) -> Any:
+    """Parse JSON bytes, in C when orjson is available."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize like json.dump(indent=2, ensure_ascii=False), as UTF-8 bytes."""
+    if orjson is not None:
+        # orjson serializes dataclasses such as Technique natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_dataclass_fields).encode('utf-8')
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Serialize data and write it to path in one write, atomically.
+    
+    The bytes go to a sibling .tmp file which is renamed over path, so an
+    interrupted run never leaves a half-written belt file; a failed write
+    removes the .tmp file and leaves path untouched.
+    """
+    buf = _dumps(data)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(buf)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+    """json.dumps default hook for the stdlib fallback"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 class LineWorkProcessor:
+    # (keyword alternation, category), checked in order; first match wins.
+    # Category and target area strings are interned so every technique
+    # shares one object per value, making set/dict dedup an identity check
+    _CATEGORY_RULES = (
+        (re.compile(r'stance|ready'), sys.intern('Stances')),
+        (re.compile(r'kick'), sys.intern('Kicks')),
+        (re.compile(r'block|guard'), sys.intern('Blocking')),
+        (re.compile(r'punch|strike|thrust|fist|elbow'), sys.intern('Striking')),
+        (re.compile(r'grab|grasp|release'), sys.intern('Grappling')),
+        (re.compile(r'spin|turn|jump'), sys.intern('Movement')),
+    )
+    
+    _DEFAULT_CATEGORY = sys.intern('Techniques')
+    
+    # (keyword alternation, target area), checked in order; first match wins
+    _TARGET_AREA_RULES = (
+        (re.compile(r'high|head|upper'), sys.intern('High section')),
+        (re.compile(r'middle|solar plexus'), sys.intern('Middle section')),
+        (re.compile(r'low|leg|waist'), sys.intern('Low section')),
+    )
+    
+    # (keyword alternation, key point) added when any technique matches
+    _KEY_POINT_RULES = (
+        (re.compile(r'stance'), "Maintain proper stance foundation throughout"),
+        (re.compile(r'kick'), "Control balance during kicking techniques"),
+        (re.compile(r'block'), "Effective blocking coverage and timing"),
+        (re.compile(r'punch|strike'), "Generate power through hip rotation and body mechanics"),
+    )
+    
+    # Bit i of a key point flag set means _KEY_POINT_RULES[i] matched; the
+    # next bit flags an exercise with more than two techniques
+    _MULTI_TECHNIQUE_FLAG = 1 << len(_KEY_POINT_RULES)
+    
+    # Flag set -> its key points, in rule order, for every combination
+    _KEY_POINT_TABLE = _flag_table(tuple(key_point for _, key_point in _KEY_POINT_RULES) +
+                                   ("Smooth coordination between multiple techniques",))
+    
+    # CSV columns unpacked by process_csv_row, in order; Notes is optional
+    _CSV_COLUMNS = ('Belt Level', 'Belt ID', 'Order', 'Exercise Name', 'Direction',
+                    'Movement Type', 'Techniques (pipe-separated)', 'Repetitions', 'Notes')
+    
+    # Common mistakes and execution tips, the same for every exercise; tuples
+    # so all exercises can share them safely
+    _COMMON_MISTAKES = (
+        "Poor timing between techniques",
+        "Insufficient power generation",
+        "Loss of balance during execution",
+        "Incorrect technique sequencing"
+    )
+    _EXECUTION_TIPS = (
+        "Practice each component technique separately first",
+        "Focus on smooth transitions between movements",
+        "Maintain proper form throughout execution"
+    )
+    
+    # Pattern names recognised in (lowercased) exercise notes, in priority order
+    _PATTERN_NAMES = ('won hyo', 'joong gun', 'yul gok', 'toi gye', 'hwa rang')
+    _PATTERN_RE = re.compile('|'.join(map(re.escape, _PATTERN_NAMES)))
+    
+    # Articles/prepositions left lowercase in titles
+    _STOPWORDS = frozenset({'and', 'or', 'in', 'on', 'to', 'of', 'from', 'into'})
+    
     def __init__(self, csv_path: str, json_dir: str):
         self.csv_path = csv_path
         self.json_dir = Path(json_dir)
@@ -23,75 +176,77 @@ class LineWorkProcessor:
             "3rd_keup": {"level": "3rd Keup", "color": "brown"},
             "2nd_keup": {"level": "2nd Keup", "color": "brown"}
         }
-        self.existing_translations = {}
-        self.load_existing_translations()
-        
-    def load_existing_translations(self):
-        """Load existing romanised/hangul translations from current JSON files"""
-        print("📚 Loading existing translations...")
-        
-        for belt_id in self.belt_mapping.keys():
-            json_file = self.json_dir / f"{belt_id}_linework.json"
-            if json_file.exists():
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                for exercise in data.get('line_work_exercises', []):
-                    for technique in exercise.get('techniques', []):
-                        key = technique['english'].lower().strip()
-                        self.existing_translations[key] = {
-                            'romanised': technique.get('romanised', ''),
-                            'hangul': technique.get('hangul', ''),
-                            'category': technique.get('category', ''),
-                            'description': technique.get('description', '')
-                        }
-        
-        print(f"✅ Loaded {len(self.existing_translations)} existing translations")
+        # Belt id -> technique key -> existing translation, loaded per belt on
+        # first use so only the belts being processed are read
+        self.existing_translations: Dict[str, Dict[str, Translation]] = {}
+        # Problems found by process_csv_row, reported by process_all after
+        # the CSV pass instead of printed row by row
+        self.row_errors: List[str] = []
+        self.exercises_without_techniques: List[str] = []
+        # Technique name -> key_point_flags result
+        self._key_point_flags: Dict[str, int] = {}
+        # Raw text -> to_title_case result; technique names repeat across rows
+        self._title_cache: Dict[str, str] = {}
+        # (belt id, technique name) -> built technique object; names repeat across rows
+        self._tech_cache: Dict[Tuple[str, str], Technique] = {}
+        
+    def translation_count(self) -> int:
+        """Number of distinct technique translations loaded so far, across belts"""
+        return len(set().union(*self.existing_translations.values()))
+    
+    def _ensure_belt_loaded(self, belt_id: str) -> Dict[str, Translation]:
+        """Load one belt's existing translations on first use"""
+        translations = self.existing_translations.get(belt_id)
+        if translations is not None:
+            return translations
+        
+        translations = self.existing_translations[belt_id] = {}
+        # One read_bytes() per file (no separate exists() stat); the parser
+        # then runs over the whole contiguous buffer
+        json_file = self.json_dir / f"{belt_id}_linework.json"
+        try:
+            data = _loads(json_file.read_bytes())
+        except FileNotFoundError:
+            return translations
+        
+        for exercise in data.get('line_work_exercises', []):
+            for technique in exercise.get('techniques', []):
+                key = technique['english'].lower().strip()
+                translations[key] = (
+                    technique.get('romanised', ''),
+                    technique.get('hangul', ''),
+                    technique.get('description', '')
+                )
+        return translations
+    
+    def find_translation(self, key: str, belt_id: str) -> Optional[Translation]:
+        """
+        Existing translation for a technique key from the belt's own file.
+        
+        Only that belt's file is read. Unlike the old up-front merge of every
+        belt, where the highest belt holding a key won, a technique missing
+        from its own belt's file gets the placeholder translation.
+        """
+        return self._ensure_belt_loaded(belt_id).get(key)
     
     def to_title_case(self, text: str) -> str:
-        """Convert to Title Case with proper handling of special cases"""
+        """Convert to Title Case, keeping articles/prepositions lowercase"""
         if not text:
             return text
-            
-        # Handle special cases
-        special_cases = {
-            'x-fist': 'X-Fist',
-            'x-block': 'X-Block', 
-            'u-shaped': 'U-Shaped',
-            'w shaped': 'W Shaped',
-            'l stance': 'L Stance',
-            '(x2)': '(x2)',
-            '(360 deg)': '(360 deg)',
-            '(180 deg)': '(180 deg)',
-            '(same leg)': '(Same Leg)',
-            'won hyo': 'Won Hyo',
-            'joong gun': 'Joong Gun',
-            'yul gok': 'Yul Gok',
-            'toi gye': 'Toi Gye',
-            'hwa rang': 'Hwa Rang'
-        }
-        
-        text = text.strip()
-        lower_text = text.lower()
         
-        # Check for exact special case matches
-        for special, replacement in special_cases.items():
-            if special in lower_text:
-                text = text.replace(special, replacement)
-                text = text.replace(special.title(), replacement)
+        cached = self._title_cache.get(text)
+        if cached is not None:
+            return cached
         
-        # Apply title case
-        words = text.split()
-        result = []
+        # Apply title case, lowercasing once up front; articles/prepositions
+        # stay lowercase unless they're the first word
+        words = text.lower().split()
+        stopwords = self._STOPWORDS
+        result = ' '.join([words[0].capitalize()] +
+                          [word if word in stopwords else word.capitalize() for word in words[1:]]) if words else ''
         
-        for word in words:
-            # Don't title case articles/prepositions unless they're first word
-            if word.lower() in ['and', 'or', 'in', 'on', 'to', 'of', 'from', 'into'] and len(result) > 0:
-                result.append(word.lower())
-            else:
-                result.append(word.capitalize())
-        
-        return ' '.join(result)
+        self._title_cache[text] = result
+        return result
     
     def parse_techniques(self, techniques_str: str) -> List[str]:
         """Parse pipe-separated technique string"""
@@ -101,63 +256,70 @@ class LineWorkProcessor:
         techniques = [t.strip() for t in techniques_str.split('|') if t.strip()]
         return [self.to_title_case(tech) for tech in techniques]
     
-    def infer_category(self, technique_name: str) -> str:
-        """Infer category based on technique name"""
-        name_lower = technique_name.lower()
+    def infer_category(self, technique_name: str, name_lower: Optional[str] = None) -> str:
+        """Infer category based on technique name (name_lower: its precomputed .lower())"""
+        if name_lower is None:
+            name_lower = technique_name.lower()
         
-        if any(word in name_lower for word in ['stance', 'ready']):
-            return 'Stances'
-        elif any(word in name_lower for word in ['kick', 'kicking']):
-            return 'Kicks'
-        elif any(word in name_lower for word in ['block', 'blocking', 'guard']):
-            return 'Blocking'
-        elif any(word in name_lower for word in ['punch', 'strike', 'thrust', 'fist', 'elbow']):
-            return 'Striking'
-        elif any(word in name_lower for word in ['grab', 'grasp', 'release']):
-            return 'Grappling'
-        elif any(word in name_lower for word in ['spin', 'turn', 'jump']):
-            return 'Movement'
-        else:
-            return 'Techniques'
+        for keywords, category in self._CATEGORY_RULES:
+            if keywords.search(name_lower):
+                return category
+        return self._DEFAULT_CATEGORY
     
-    def get_target_area(self, technique_name: str) -> Optional[str]:
-        """Determine target area from technique name"""
-        name_lower = technique_name.lower()
+    def get_target_area(self, technique_name: str, name_lower: Optional[str] = None) -> Optional[str]:
+        """Determine target area from technique name (name_lower: its precomputed .lower())"""
+        if name_lower is None:
+            name_lower = technique_name.lower()
         
-        if any(word in name_lower for word in ['high', 'head', 'upper']):
-            return 'High section'
-        elif any(word in name_lower for word in ['middle', 'middle section', 'solar plexus']):
-            return 'Middle section'
-        elif any(word in name_lower for word in ['low', 'leg', 'waist']):
-            return 'Low section'
-        else:
-            return None
+        for keywords, target_area in self._TARGET_AREA_RULES:
+            if keywords.search(name_lower):
+                return target_area
+        return None
     
-    def create_technique_object(self, technique_name: str) -> Dict[str, Any]:
+    def create_technique_object(self, technique_name: str, belt_id: str) -> Technique:
         """Create technique object with translations and metadata"""
-        key = technique_name.lower().strip()
+        # Techniques are immutable, so repeats share one instance
+        cached = self._tech_cache.get((belt_id, technique_name))
+        if cached is not None:
+            return cached
+        
+        # Lowercase once and share it with the helpers below
+        name_lower = technique_name.lower()
+        key = name_lower.strip()
         
         # Use existing translation if available
-        if key in self.existing_translations:
-            translation = self.existing_translations[key]
-            romanised = translation['romanised']
-            hangul = translation['hangul']
-            description = translation['description']
+        translation = self.find_translation(key, belt_id)
+        if translation is not None:
+            romanised, hangul, description = translation
         else:
             # Use fallback - keep existing translations intact
             romanised = "Technique Name"  # Placeholder - should be updated manually later
             hangul = "기술명"  # Placeholder 
-            description = f"Execute {technique_name.lower()} with proper form and technique"
+            description = f"Execute {name_lower} with proper form and technique"
         
-        return {
-            "id": re.sub(r'[^a-z0-9_]', '_', technique_name.lower().replace(' ', '_')),
-            "english": technique_name,
-            "romanised": romanised,
-            "hangul": hangul,
-            "category": self.infer_category(technique_name),
-            "target_area": self.get_target_area(technique_name),
-            "description": description
-        }
+        technique = Technique(
+            id=_ID_RE.sub('_', name_lower),
+            english=technique_name,
+            romanised=romanised,
+            hangul=hangul,
+            category=self.infer_category(technique_name, name_lower),
+            target_area=self.get_target_area(technique_name, name_lower),
+            description=description
+        )
+        self._tech_cache[(belt_id, technique_name)] = technique
+        return technique
+    
+    def key_point_flags(self, technique_name: str) -> int:
+        """Bit set of the _KEY_POINT_RULES matching a technique name (cached)"""
+        flags = self._key_point_flags.get(technique_name)
+        if flags is None:
+            name_lower = technique_name.lower()
+            flags = 0
+            for bit, (keywords, _) in enumerate(self._KEY_POINT_RULES):
+                if keywords.search(name_lower):
+                    flags |= 1 << bit
+            self._key_point_flags[technique_name] = flags
+        return flags
     
     def generate_execution_content(self, exercise_name: str, techniques: List[str], 
                                  direction: str, repetitions: int, notes: str = "") -> Dict[str, Any]:
@@ -175,123 +337,148 @@ class LineWorkProcessor:
         else:
             pattern = f"Execute {exercise_name.lower()} with proper timing and form"
         
-        # Generate key points based on techniques
-        key_points = []
-        if any('stance' in t.lower() for t in techniques):
-            key_points.append("Maintain proper stance foundation throughout")
-        if any('kick' in t.lower() for t in techniques):
-            key_points.append("Control balance during kicking techniques")
-        if any('block' in t.lower() for t in techniques):
-            key_points.append("Effective blocking coverage and timing")
-        if any('punch' in t.lower() or 'strike' in t.lower() for t in techniques):
-            key_points.append("Generate power through hip rotation and body mechanics")
+        # Generate key points based on techniques: OR together each name's
+        # cached rule bits, then look the combination up in the table
+        flags = 0
+        for name in techniques:
+            flags |= self.key_point_flags(name)
         if len(techniques) > 2:
-            key_points.append("Smooth coordination between multiple techniques")
+            flags |= self._MULTI_TECHNIQUE_FLAG
+        key_points = list(self._KEY_POINT_TABLE[flags])
         
         # Add notes-specific key points
-        if notes and "won hyo" in notes.lower():
-            key_points.append("Follow Won Hyo pattern timing and characteristics")
-        elif notes and any(pattern in notes.lower() for pattern in ["joong gun", "yul gok", "toi gye", "hwa rang"]):
-            pattern_name = next(p for p in ["joong gun", "yul gok", "toi gye", "hwa rang"] if p in notes.lower())
-            key_points.append(f"Execute according to {pattern_name.title()} pattern requirements")
-        
-        # Generate common mistakes
-        common_mistakes = [
-            "Poor timing between techniques",
-            "Insufficient power generation", 
-            "Loss of balance during execution",
-            "Incorrect technique sequencing"
-        ]
-        
-        # Generate execution tips
-        execution_tips = [
-            "Practice each component technique separately first",
-            "Focus on smooth transitions between movements",
-            "Maintain proper form throughout execution"
-        ]
+        # (one scan for all pattern names; if several are mentioned the
+        # highest-priority one wins, not the first in the text)
+        mentioned = set(self._PATTERN_RE.findall(notes.lower())) if notes else ()
+        if mentioned:
+            pattern_name = next(p for p in self._PATTERN_NAMES if p in mentioned)
+            if pattern_name == "won hyo":
+                key_points.append("Follow Won Hyo pattern timing and characteristics")
+            else:
+                key_points.append(f"Execute according to {pattern_name.title()} pattern requirements")
         
         return {
             "direction": direction.lower() if direction.upper() in ["FWD", "BWD", "STATIC"] else "both",
             "repetitions": repetitions,
             "movement_pattern": pattern,
             "key_points": key_points,
-            "common_mistakes": common_mistakes,
-            "execution_tips": execution_tips
+            "common_mistakes": self._COMMON_MISTAKES,
+            "execution_tips": self._EXECUTION_TIPS
         }
     
-    def process_csv_row(self, row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-        """Process a single CSV row into exercise object"""
+    def csv_column_indices(self, header: Sequence[str]) -> Tuple[Optional[int], ...]:
+        """Resolve _CSV_COLUMNS to positions in the CSV header (None if Notes is absent)"""
+        positions = {name: i for i, name in enumerate(header)}
+        indices = tuple(positions.get(name) for name in self._CSV_COLUMNS)
+        missing = [name for name, i in zip(self._CSV_COLUMNS[:-1], indices) if i is None]
+        if missing:
+            raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+        return indices
+    
+    def process_csv_row(self, row: Sequence[str], columns: Tuple[Optional[int], ...]) -> Optional[Dict[str, Any]]:
+        """Process a single CSV row (fields at the csv_column_indices positions) into exercise object"""
+        (level_col, belt_col, order_col, name_col, direction_col,
+         type_col, techniques_col, repetitions_col, notes_col) = columns
+        
+        # Validate explicitly rather than catching exceptions for bad rows
         try:
-            belt_level = row['Belt Level'].strip()
-            belt_id = row['Belt ID'].strip()
-            order = int(row['Order'])
-            exercise_name = self.to_title_case(row['Exercise Name'].strip())
-            direction = row['Direction'].strip()
-            movement_type = row['Movement Type'].strip()
-            techniques_str = row['Techniques (pipe-separated)'].strip()
-            repetitions = int(row['Repetitions']) if row['Repetitions'].strip() else 5
-            notes = row['Notes'].strip() if 'Notes' in row else ""
-            
-            # Parse techniques
-            technique_names = self.parse_techniques(techniques_str)
-            if not technique_names:
-                print(f"⚠️  No techniques found for {exercise_name}")
-                return None
-            
-            # Create technique objects
-            techniques = [self.create_technique_object(name) for name in technique_names]
-            
-            # Generate execution content
-            execution = self.generate_execution_content(
-                exercise_name, technique_names, direction, repetitions, notes
-            )
-            
-            # Determine categories
-            categories = list(set(tech['category'] for tech in techniques))
-            
-            # Create exercise object
-            exercise = {
-                "id": re.sub(r'[^a-z0-9_]', '_', exercise_name.lower().replace(' ', '_')),
-                "movement_type": movement_type,
-                "order": order,
-                "name": exercise_name,
-                "techniques": techniques,
-                "execution": execution,
-                "categories": sorted(categories)
-            }
-            
-            # Add notes if present
-            if notes:
-                exercise["notes"] = notes
-            
-            return exercise
-            
-        except Exception as e:
-            print(f"❌ Error processing row {row}: {e}")
+            belt_level = row[level_col].strip()
+            belt_id = row[belt_col].strip()
+            order_raw = row[order_col]
+            name_raw = row[name_col]
+            direction = row[direction_col].strip()
+            movement_type = row[type_col].strip()
+            techniques_str = row[techniques_col].strip()
+            repetitions_raw = row[repetitions_col]
+            notes = row[notes_col].strip() if notes_col is not None else ""
+        except IndexError:
+            self.row_errors.append(f"❌ Error processing row {row}: too few columns ({len(row)})")
+            return None
+        
+        order = _parse_int(order_raw)
+        if order is None:
+            self.row_errors.append(f"❌ Error processing row {row}: invalid Order {order_raw!r}")
+            return None
+        repetitions = _parse_int(repetitions_raw) if repetitions_raw.strip() else 5
+        if repetitions is None:
+            self.row_errors.append(f"❌ Error processing row {row}: invalid Repetitions {repetitions_raw!r}")
+            return None
+        
+        exercise_name = self.to_title_case(name_raw.strip())
+        
+        # Parse techniques
+        technique_names = self.parse_techniques(techniques_str)
+        if not technique_names:
+            self.exercises_without_techniques.append(exercise_name)
             return None
+        
+        # Create technique objects
+        techniques = [self.create_technique_object(name, belt_id) for name in technique_names]
+        
+        # Generate execution content
+        execution = self.generate_execution_content(
+            exercise_name, technique_names, direction, repetitions, notes
+        )
+        
+        # Determine categories
+        categories = sorted({tech.category for tech in techniques})
+        
+        # Create exercise object
+        exercise = {
+            "id": _ID_RE.sub('_', exercise_name.lower()),
+            "movement_type": movement_type,
+            "order": order,
+            "name": exercise_name,
+            "techniques": techniques,
+            "execution": execution,
+            "categories": categories
+        }
+        
+        # Add notes if present
+        if notes:
+            exercise["notes"] = notes
+        
+        return exercise
+    
+    def report_row_problems(self) -> None:
+        """Print (and clear) the row errors and warnings collected by process_csv_row"""
+        lines = self.row_errors
+        skipped = self.exercises_without_techniques
+        if skipped:
+            shown = ', '.join(skipped[:10])
+            more = f" (+{len(skipped) - 10} more)" if len(skipped) > 10 else ""
+            lines.append(f"⚠️  {len(skipped)} exercises without techniques: {shown}{more}")
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+        self.row_errors = []
+        self.exercises_without_techniques = []
     
     def process_belt_level(self, belt_id: str, exercises: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create complete belt level JSON structure"""
         belt_info = self.belt_mapping[belt_id]
         
-        # Generate skill focus based on exercises
+        # Generate skill focus based on exercises, detecting every feature in
+        # one pass and stopping early once all have been seen
+        has_patterns = has_complex = has_kicks = has_l_stance = False
+        for ex in exercises:
+            if not has_patterns and 'notes' in ex:
+                has_patterns = self._PATTERN_RE.search(ex['notes'].lower()) is not None
+            if not has_complex:
+                has_complex = len(ex['techniques']) > 3
+            if not has_kicks:
+                has_kicks = 'Kicks' in ex['categories']
+            if not has_l_stance:
+                has_l_stance = any('l stance' in tech.english.lower() for tech in ex['techniques'])
+            if has_patterns and has_complex and has_kicks and has_l_stance:
+                break
+        
         skill_focuses = []
-        has_patterns = any('notes' in ex and any(p in ex['notes'].lower() 
-                          for p in ['won hyo', 'joong gun', 'yul gok', 'toi gye', 'hwa rang']) 
-                         for ex in exercises)
         if has_patterns:
             skill_focuses.append("Pattern integration and application")
-        
-        has_complex = any(len(ex['techniques']) > 3 for ex in exercises)
         if has_complex:
             skill_focuses.append("Complex multi-technique combinations")
-        
-        has_kicks = any('Kicks' in ex['categories'] for ex in exercises)
         if has_kicks:
             skill_focuses.append("Advanced kicking techniques")
-        
-        has_l_stance = any(any('l stance' in tech['english'].lower() 
-                              for tech in ex['techniques']) for ex in exercises)
         if has_l_stance:
             skill_focuses.append("L stance proficiency and applications")
         
@@ -319,39 +506,51 @@ class LineWorkProcessor:
         # Read CSV data
         belt_exercises = {}
         
-        with open(self.csv_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        # Plain csv.reader rows, indexed by header positions resolved once
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            columns = self.csv_column_indices(next(reader, ()))
+            belt_col = columns[1]
             
             for row in reader:
-                belt_id = row['Belt ID'].strip()
+                # DictReader skipped blank lines; keep doing so
+                if not row:
+                    continue
+                
+                belt_id = row[belt_col].strip()
                 
                 # Only process the belts we want to update
                 if belt_id not in self.belt_mapping:
                     continue
                 
-                exercise = self.process_csv_row(row)
+                exercise = self.process_csv_row(row, columns)
                 if exercise:
                     if belt_id not in belt_exercises:
                         belt_exercises[belt_id] = []
                     belt_exercises[belt_id].append(exercise)
         
+        self.report_row_problems()
+        print(f"✅ Loaded {self.translation_count()} existing translations "
+              f"from {len(self.existing_translations)} belt levels")
+        
         # Process each belt level
         results = {}
         for belt_id, exercises in belt_exercises.items():
-            print(f"📝 Processing {belt_id}: {len(exercises)} exercises")
-            
             # Sort exercises by order
             exercises.sort(key=lambda x: x['order'])
             
             # Create belt level data
-            belt_data = self.process_belt_level(belt_id, exercises)
-            results[belt_id] = belt_data
-            
-            # Write to file
-            output_file = self.json_dir / f"{belt_id}_linework.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(belt_data, f, indent=2, ensure_ascii=False)
-            
+            results[belt_id] = self.process_belt_level(belt_id, exercises)
+        
+        # Serialize and write the belt files in parallel (orjson and the
+        # write syscall both release the GIL), then report in belt order
+        output_files = [self.json_dir / f"{belt_id}_linework.json" for belt_id in results]
+        if results:
+            with ThreadPoolExecutor(max_workers=min(4, len(results))) as executor:
+                list(executor.map(_write_json, output_files, results.values()))
+        
+        for (belt_id, belt_data), output_file in zip(results.items(), output_files):
+            print(f"📝 Processing {belt_id}: {len(belt_data['line_work_exercises'])} exercises")
             print(f"✅ Updated {output_file}")
         
         return results